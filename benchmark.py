@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Performans Olcum Araci (Benchmark)
+==================================
+Sifreleme zincirinin her asamasinin veri hizini (MB/s) ve cagri
+gecikmesi yuzdeliklerini olcer, sonuclari JSON olarak raporlar ve
+kayitli bir referans (baseline) ile karsilastirarak gerilemeleri isaretler.
+
+Ornek:
+    python benchmark.py --output baseline.json
+    python benchmark.py --sizes 16 4096 1048576 --baseline baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from collatz_crypto import CollatzCrypto
+from key_generator import KeyGenerator
+
+
+# Varsayilan tarama: 16 B'den 100 MB'a kadar
+DEFAULT_SIZES = [16, 256, 4096, 65536, 1 << 20, 16 << 20, 100 << 20]
+
+# Kisa ve uzun durma surelerine sahip seed'ler (4, 111, 178, 949 adim)
+DEFAULT_SEEDS = [16, 27, 871, 63728127]
+
+# Farkli uzunlukta transposition anahtarlari
+DEFAULT_TRANS_KEYS = ['21', '3142', '918273645']
+
+# Bit listesi ureten asamalar icin ust sinir (byte); 1 MB = 8 milyon liste elemani
+SLOW_STAGE_LIMIT = 1 << 20
+
+# Her olcum icin zaman butcesi (saniye) ve tekrar sayisi sinirlari
+TIME_BUDGET = 1.0
+MIN_RUNS = 5
+MAX_RUNS = 1000
+
+# Varsayilan gerileme esigi (%10 yavaslama)
+DEFAULT_THRESHOLD = 0.10
+
+
+def _stage_table() -> Dict[str, Dict]:
+    """
+    Olculecek asamalari tanimla.
+
+    Her asama icin: hazirlik fonksiyonu (crypto, generator, veri) → cagri,
+    seed'e ve transposition anahtarina bagli olup olmadigi ve veri boyutu siniri.
+    """
+    return {
+        'generate_collatz_sequence': {
+            'setup': lambda c, g, d: (lambda: c.generate_collatz_sequence(c.seed, len(d) * 8)),
+            'seed': True, 'key': False, 'limit': SLOW_STAGE_LIMIT
+        },
+        'xor_with_collatz': {
+            'setup': lambda c, g, d: (lambda: c.xor_with_collatz(d)),
+            'seed': True, 'key': False, 'limit': None
+        },
+        'affine_encrypt': {
+            'setup': lambda c, g, d: (lambda: c.affine_encrypt(d)),
+            'seed': False, 'key': False, 'limit': None
+        },
+        'transpose_encrypt': {
+            'setup': lambda c, g, d: (lambda: c.transpose_encrypt(d)),
+            'seed': False, 'key': True, 'limit': None
+        },
+        'encrypt': {
+            'setup': lambda c, g, d: (lambda: c.encrypt_bytes(d)),
+            'seed': True, 'key': True, 'limit': None
+        },
+        'decrypt': {
+            'setup': _setup_decrypt,
+            'seed': True, 'key': True, 'limit': None
+        },
+        'analyze_collatz_seed': {
+            'setup': lambda c, g, d: (lambda: g.analyze_collatz_seed(c.seed, len(d) * 8)),
+            'seed': True, 'key': False, 'limit': SLOW_STAGE_LIMIT
+        },
+    }
+
+
+def _setup_decrypt(crypto: CollatzCrypto, generator: KeyGenerator, data: bytes) -> Callable:
+    """Sifre cozme olcumu icin veriyi onceden sifrele."""
+    ciphertext = crypto.encrypt_bytes(data)
+    return lambda: crypto.decrypt_bytes(ciphertext, len(data))
+
+
+def time_calls(func: Callable, repeat: int = None, budget: float = TIME_BUDGET) -> np.ndarray:
+    """
+    Fonksiyonu tekrar tekrar cagirip her cagrinin suresini olc.
+
+    Sabit tekrar sayisi verilmezse zaman butcesi dolana kadar (en az
+    MIN_RUNS, en fazla MAX_RUNS kez) cagrilir; boylece yavas asamalar
+    da olcumu makul surede bitirir.
+
+    Args:
+        func: Olculecek fonksiyon
+        repeat: Sabit tekrar sayisi (varsayilan: zaman butcesine gore)
+        budget: Olcum basina zaman butcesi (saniye)
+
+    Returns:
+        Cagri sureleri (saniye)
+    """
+    func()  # Isinma: onbellekler ve tablolar hazirlanir
+    timings = []
+    deadline = time.perf_counter() + budget
+    while True:
+        start = time.perf_counter()
+        func()
+        end = time.perf_counter()
+        timings.append(end - start)
+
+        if repeat is not None:
+            if len(timings) >= repeat:
+                break
+        elif len(timings) >= MAX_RUNS or (len(timings) >= MIN_RUNS and end >= deadline):
+            break
+    return np.array(timings)
+
+
+def summarize(timings: np.ndarray, size: int) -> Dict:
+    """Sure olcumlerinden hiz ve gecikme yuzdeliklerini hesapla."""
+    p50, p90, p99 = np.percentile(timings, [50, 90, 99])
+    return {
+        'repeat': len(timings),
+        'mb_per_s': size / p50 / 1e6 if p50 > 0 else float('inf'),
+        'latency_us': {
+            'min': float(timings.min() * 1e6),
+            'mean': float(timings.mean() * 1e6),
+            'p50': float(p50 * 1e6),
+            'p90': float(p90 * 1e6),
+            'p99': float(p99 * 1e6),
+        }
+    }
+
+
+def run_benchmarks(sizes: List[int] = None, seeds: List[int] = None,
+                   trans_keys: List[str] = None, stages: List[str] = None,
+                   repeat: int = None, log: Callable = print) -> Dict:
+    """
+    Asama × boyut × seed × anahtar taramasini calistir.
+
+    Bir asama seed'e veya anahtara bagli degilse o boyut icin tek kez olculur.
+
+    Args:
+        sizes: Veri boyutlari (byte)
+        seeds: Collatz seed degerleri
+        trans_keys: Transposition anahtarlari
+        stages: Olculecek asama adlari (varsayilan: hepsi)
+        repeat: Sabit tekrar sayisi (varsayilan: olcum basina ~1 s butce)
+        log: Ilerleme mesajlari icin fonksiyon
+
+    Returns:
+        JSON'a yazilabilir sonuc sozlugu
+    """
+    sizes = sizes or DEFAULT_SIZES
+    seeds = seeds or DEFAULT_SEEDS
+    trans_keys = trans_keys or DEFAULT_TRANS_KEYS
+    table = _stage_table()
+    stages = stages or list(table)
+    generator = KeyGenerator()
+
+    results = []
+    for size in sizes:
+        data = os.urandom(size)
+
+        for name in stages:
+            stage = table[name]
+            if stage['limit'] is not None and size > stage['limit']:
+                continue
+
+            for seed in (seeds if stage['seed'] else seeds[:1]):
+                for trans_key in (trans_keys if stage['key'] else trans_keys[:1]):
+                    crypto = CollatzCrypto(seed=seed, trans_key=trans_key)
+                    func = stage['setup'](crypto, generator, data)
+                    summary = summarize(time_calls(func, repeat), size)
+
+                    results.append({
+                        'stage': name, 'size': size,
+                        'seed': seed if stage['seed'] else None,
+                        'trans_key': trans_key if stage['key'] else None,
+                        **summary
+                    })
+                    log(f"  {name:<26} {size:>10} B  seed={seed:<9} key={trans_key:<10} "
+                        f"{summary['mb_per_s']:>10.2f} MB/s  "
+                        f"p50={summary['latency_us']['p50']:.1f} us")
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+        },
+        'results': results
+    }
+
+
+def _result_key(result: Dict) -> tuple:
+    return (result['stage'], result['size'], result['seed'], result['trans_key'])
+
+
+def compare_to_baseline(report: Dict, baseline: Dict,
+                        threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Sonuclari referans olcumle karsilastir.
+
+    Args:
+        report: Guncel olcum raporu
+        baseline: Referans olcum raporu
+        threshold: Izin verilen en fazla goreli yavaslama (0.10 = %10)
+
+    Returns:
+        Gerileme gosteren olcumlerin listesi
+    """
+    reference = {_result_key(r): r for r in baseline.get('results', [])}
+    regressions = []
+
+    for result in report['results']:
+        base = reference.get(_result_key(result))
+        if base is None:
+            continue
+
+        ratio = result['mb_per_s'] / base['mb_per_s'] if base['mb_per_s'] else float('inf')
+        if ratio < 1 - threshold:
+            regressions.append({
+                'stage': result['stage'], 'size': result['size'],
+                'seed': result['seed'], 'trans_key': result['trans_key'],
+                'baseline_mb_per_s': base['mb_per_s'],
+                'mb_per_s': result['mb_per_s'],
+                'ratio': ratio
+            })
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Collatz sifreleme zinciri performans olcumu'
+    )
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        help='Veri boyutlari, byte (varsayilan: 16 B - 100 MB)')
+    parser.add_argument('--seeds', type=int, nargs='+',
+                        help=f'Collatz seed degerleri (varsayilan: {DEFAULT_SEEDS})')
+    parser.add_argument('--trans-keys', nargs='+',
+                        help=f'Transposition anahtarlari (varsayilan: {DEFAULT_TRANS_KEYS})')
+    parser.add_argument('--stages', nargs='+', choices=list(_stage_table()),
+                        help='Olculecek asamalar (varsayilan: hepsi)')
+    parser.add_argument('--repeat', type=int,
+                        help=f'Tekrar sayisi (varsayilan: olcum basina ~{TIME_BUDGET:g} s, en az {MIN_RUNS})')
+    parser.add_argument('--output', help='JSON raporun yazilacagi dosya (varsayilan: stdout)')
+    parser.add_argument('--baseline', help='Karsilastirilacak referans JSON rapor')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Gerileme esigi (varsayilan: {DEFAULT_THRESHOLD})')
+    args = parser.parse_args()
+
+    # Ilerleme mesajlari stderr'e, JSON rapor stdout'a
+    report = run_benchmarks(
+        sizes=args.sizes, seeds=args.seeds, trans_keys=args.trans_keys,
+        stages=args.stages, repeat=args.repeat,
+        log=lambda text: print(text, file=sys.stderr)
+    )
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        report['regressions'] = regressions
+
+        for r in regressions:
+            print(f"[GERILEME] {r['stage']} {r['size']} B seed={r['seed']} key={r['trans_key']}: "
+                  f"{r['baseline_mb_per_s']:.2f} -> {r['mb_per_s']:.2f} MB/s "
+                  f"({(1 - r['ratio']) * 100:.1f}% yavas)", file=sys.stderr)
+        if regressions:
+            exit_code = 1
+        else:
+            print("[INFO] Referansa gore gerileme yok.", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"[INFO] Rapor '{args.output}' dosyasina kaydedildi.", file=sys.stderr)
+    else:
+        print(output)
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,7 +11,313 @@ Yazar: Mehmet Sait Dündar
 
 import argparse
 import math
-from typing import Tuple, List
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+import threading
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from functools import lru_cache
+from typing import BinaryIO, Callable, Sequence, Tuple, List
+
+import numpy as np
+
+from key_generator import KeyGenerator
+
+# Birleşik çekirdeğin tek seferde işlediği pencere boyutu (byte)
+_KERNEL_WINDOW = 1 << 16
+
+# Akış şifrelemede varsayılan parça boyutu (byte)
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Paralel şifrelemede bir işçiye verilecek en küçük parça (byte)
+_PARALLEL_MIN_CHUNK = 1 << 20
+
+# Toplu şifrelemede tek matriste işlenen en fazla mesaj sayısı
+_BATCH_ROWS = 4096
+
+
+# Hızlandırılmış Collatz yürüyüşünde tek tablo adımının işlediği bit sayısı
+_COLLATZ_TABLE_BITS = 12
+
+
+@lru_cache(maxsize=4)
+def _collatz_step_table(k: int) -> List[Tuple[str, int, int, int]]:
+    """
+    Alt k bite göre sonraki k Collatz adımının tablosunu oluştur.
+    
+    x = q·2^k + r için sonraki k adımın parite dizisi yalnızca r'ye bağlıdır
+    (her bölme bir bit tüketir, k adımda en fazla k bölme olur). o tek
+    adım ve e bölme sonrasında:
+    
+        x_k = q·3^o·2^(k-e) + f(r)
+    
+    Args:
+        k: Tablo bit sayısı
+        
+    Returns:
+        r → (parite bitleri, 3^o, k - e, f(r)) listesi
+    """
+    table = []
+    for r in range(1 << k):
+        parity = []
+        odd = halvings = 0
+        current = r
+        for _ in range(k):
+            if current % 2 == 0:
+                parity.append('0')
+                halvings += 1
+                current //= 2
+            else:
+                parity.append('1')
+                odd += 1
+                current = 3 * current + 1
+        table.append((''.join(parity), 3 ** odd, k - halvings, current))
+    return table
+
+
+def _collatz_parity(n: int, max_bits: int = None) -> str:
+    """
+    n'den 1'e ulaşana kadar Collatz parite bitlerini üret.
+    
+    Değer 2^k'den büyükken her adımda tablo ile k adım birden atlanır
+    (tek bir bignum çarpma ve kaydırma). Bu bölgede ara değerler 1'e
+    inemez; küçük değerlerde tek adımlara dönülür ve 1 tam olarak yakalanır.
+    
+    Args:
+        n: Başlangıç değeri (n == 1 ise boş dizi)
+        max_bits: Yeterli bit üretildiğinde erken dur (sonuç daha uzun olabilir)
+        
+    Returns:
+        '0'/'1' karakterlerinden oluşan parite dizisi (tek → 1, çift → 0)
+    """
+    k = _COLLATZ_TABLE_BITS
+    table = _collatz_step_table(k)
+    limit = 1 << k
+    mask = limit - 1
+    chunks = []
+    produced = 0
+    current = n
+    
+    while current > limit and (max_bits is None or produced < max_bits):
+        parity, multiplier, shift, remainder = table[current & mask]
+        current = ((current >> k) * multiplier << shift) + remainder
+        chunks.append(parity)
+        produced += k
+    
+    while current != 1 and (max_bits is None or produced < max_bits):
+        if current % 2 == 0:
+            chunks.append('0')  # Çift → 0
+            current = current // 2
+        else:
+            chunks.append('1')  # Tek → 1
+            current = 3 * current + 1
+        produced += 1
+    
+    return ''.join(chunks)
+
+
+@lru_cache(maxsize=256)
+def _collatz_cycle(seed: int) -> Tuple[int, int]:
+    """
+    Seed'in tam bir Collatz periyodunu hesapla (seed → ... → 1).
+    
+    Anahtar akışı her 1'e ulaşıldığında seed'den yeniden başladığı için
+    tamamen periyodiktir; periyot seed'in toplam durma süresine eşittir.
+    
+    Args:
+        seed: Collatz başlangıç değeri (pozitif)
+        
+    Returns:
+        (Periyot bitleri tek bir tamsayı olarak - ilk bit en anlamlı,
+         periyot uzunluğu)
+    """
+    # İlk adım her zaman atılır (seed = 1 için periyot 1 → 4 → 2 → 1)
+    if seed % 2 == 0:
+        bits = '0' + _collatz_parity(seed // 2)
+    else:
+        bits = '1' + _collatz_parity(3 * seed + 1)
+    
+    return int(bits, 2), len(bits)
+
+
+@lru_cache(maxsize=256)
+def _packed_collatz_cycle(seed: int) -> bytes:
+    """
+    Collatz periyodunu byte'lara paketle.
+    
+    Periyot uzunluğu 8'in katı değilse periyot, bit sayısı 8'in katı
+    olana kadar tekrarlanır; böylece paketlenmiş döngü byte sınırında
+    kendini tekrar eder ve anahtar akışı doğrudan döşenerek üretilebilir.
+    
+    Args:
+        seed: Collatz başlangıç değeri
+        
+    Returns:
+        Paketlenmiş anahtar akışı döngüsü (her byte'ta ilk bit en anlamlı)
+    """
+    bits, length = _collatz_cycle(seed)
+    repeat = 8 // math.gcd(length, 8)
+    
+    tiled = 0
+    for _ in range(repeat):
+        tiled = (tiled << length) | bits
+    
+    return tiled.to_bytes(length * repeat // 8, 'big')
+
+
+def _transposition_order(trans_key: str) -> List[int]:
+    """
+    Transposition anahtarını 0-indexed sıralama dizisine dönüştür.
+    
+    Örnek: "3142" → [3, 1, 4, 2] → [2, 0, 3, 1]
+    Uzun anahtarlar virgülle ayrılır: "10,3,...,1"
+    
+    Args:
+        trans_key: Transposition anahtarı
+        
+    Returns:
+        Pozisyon değiştirme dizisi
+    """
+    # Anahtarı sayılara dönüştür
+    key_nums = KeyGenerator.parse_transposition_key(trans_key)
+    
+    # Sıralama pozisyonlarını bul (0-indexed)
+    sorted_key = sorted(enumerate(key_nums), key=lambda x: x[1])
+    
+    result = [0] * len(key_nums)
+    for new_pos, (old_pos, _) in enumerate(sorted_key):
+        result[old_pos] = new_pos
+    
+    return result
+
+
+# Aşama izleme kancası: (adım numarası, etiket, aşama sonrası veri)
+StageTrace = Callable[[int, str, bytes], None]
+
+# Her byte değerindeki 1 bitlerinin sayısı
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def print_stage(step: int, label: str, data: bytes) -> None:
+    """Aşama çıktısını hex olarak yazdıran varsayılan iz kancası."""
+    print(f"[{step}] {label}: {data.hex()}")
+
+
+def count_bits(data: bytes) -> Tuple[int, int]:
+    """
+    Verideki 0 ve 1 bitlerini say.
+    
+    Byte histogramı ile popcount tablosu çarpılır; bit dizisi
+    oluşturulmaz.
+    
+    Args:
+        data: İncelenecek veri
+        
+    Returns:
+        (0 sayısı, 1 sayısı)
+    """
+    histogram = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    ones = int(histogram @ _POPCOUNT)
+    return len(data) * 8 - ones, ones
+
+
+def _read_exact(reader: BinaryIO, size: int) -> bytes:
+    """
+    Akıştan tam olarak `size` byte oku (dosya sonunda daha az olabilir).
+    
+    Soketler ve borular `read` çağrısında eksik veri döndürebilir; parça
+    sınırlarının blok hizasında kalması için okuma tamamlanır.
+    
+    Args:
+        reader: İkili okuma akışı
+        size: Okunacak byte sayısı
+        
+    Returns:
+        Okunan veri
+    """
+    data = reader.read(size)
+    if not data or len(data) == size:
+        return data
+    
+    parts = [data]
+    remaining = size - len(data)
+    while remaining > 0:
+        part = reader.read(remaining)
+        if not part:
+            break
+        parts.append(part)
+        remaining -= len(part)
+    return b''.join(parts)
+
+
+def _check_distinct_paths(src_path: str, dst_path: str) -> None:
+    """Çıktı açılırken kesileceği için girdi ile aynı dosya olmasını engelle."""
+    if os.path.exists(dst_path) and os.path.samefile(src_path, dst_path):
+        raise ValueError(f"Girdi ve çıktı aynı dosya olamaz: {dst_path}")
+
+
+def _pack_rows(chunks: Sequence[bytes], lengths: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mesajları sıfırlarla tamamlanmış (mesaj sayısı, width) matrisine yerleştir.
+    
+    Tüm mesajlar tek bir birleştirme ve maskeli atama ile kopyalanır;
+    mesaj başına numpy çağrısı yapılmaz.
+    
+    Args:
+        chunks: Mesajlar
+        lengths: Mesaj uzunlukları
+        width: Satır genişliği (en uzun mesajdan küçük olamaz)
+        
+    Returns:
+        (uint8 matris, gerçek veri konumlarını gösteren maske)
+    """
+    matrix = np.zeros((len(chunks), width), dtype=np.uint8)
+    mask = np.arange(width) < lengths[:, None]
+    matrix[mask] = np.frombuffer(b''.join(chunks), dtype=np.uint8)
+    return matrix, mask
+
+
+def _unpack_rows(matrix: np.ndarray, rows: np.ndarray, lengths: np.ndarray,
+                 results: list) -> None:
+    """Matris satırlarını verilen uzunluklarda kesip sonuç listesine yerleştir."""
+    for index, row, length in zip(rows.tolist(), matrix, lengths.tolist()):
+        results[index] = row[:length].tobytes()
+
+
+def _parallel_worker(params: dict, encrypt: bool, in_name: str, in_len: int,
+                     out_name: str, out_len: int, start: int, stop: int) -> None:
+    """
+    Paylaşılan bellekteki verinin [start, stop) aralığını işle.
+    
+    Girdi ve çıktı `multiprocessing.shared_memory` üzerinden paylaşılır;
+    işçiye yalnızca anahtar parametreleri ve aralık sınırları gönderilir.
+    
+    Args:
+        params: CollatzCrypto yapıcı parametreleri
+        encrypt: True ise şifreleme, False ise çözme
+        in_name, in_len: Girdi belleğinin adı ve uzunluğu
+        out_name, out_len: Çıktı belleğinin adı ve uzunluğu
+        start, stop: İşlenecek aralık (şifrelemede girdi, çözmede çıktı üzerinde)
+    """
+    crypto = CollatzCrypto(**params)
+    key_len = len(crypto._trans_order)
+    padded_stop = -(-stop // key_len) * key_len
+    
+    in_shm = shared_memory.SharedMemory(name=in_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    try:
+        src = np.ndarray((in_len,), dtype=np.uint8, buffer=in_shm.buf)
+        dst = np.ndarray((out_len,), dtype=np.uint8, buffer=out_shm.buf)
+        if encrypt:
+            crypto._encrypt_into(src[start:stop], dst[start:padded_stop], start)
+        else:
+            crypto._decrypt_into(src[start:padded_stop], dst[start:stop], start)
+        # Bellek kapatılmadan önce görünümler bırakılmalı
+        del src, dst
+    finally:
+        in_shm.close()
+        out_shm.close()
 
 
 class CollatzCrypto:
@@ -42,12 +348,49 @@ class CollatzCrypto:
         self.trans_key = trans_key
         self.modulus = modulus
         
+        # Collatz dizisi yalnızca pozitif seed'ler için 1'e ulaşır
+        if seed < 1:
+            raise ValueError(f"Collatz seed değeri ({seed}) pozitif olmalı!")
+        
         # Affine cipher için a değerinin m ile aralarında asal olduğunu kontrol et
         if math.gcd(affine_a, modulus) != 1:
             raise ValueError(f"Affine 'a' değeri ({affine_a}) modulus ({modulus}) ile aralarında asal olmalı!")
         
         # Ters çarpanı hesapla (şifre çözme için)
         self.affine_a_inverse = self._mod_inverse(affine_a, modulus)
+        
+        # Affine dönüşümü byte'lar üzerinde sabit bir tablodur; ileri ve ters
+        # tabloları bir kez hazırla
+        if modulus > 256:
+            raise ValueError(f"Modulus ({modulus}) byte şifrelemesi için 256'dan büyük olamaz!")
+        self._affine_table = bytes(self.affine_encrypt_byte(x) for x in range(256))
+        self._affine_inverse_table = bytes(self.affine_decrypt_byte(x) for x in range(256))
+        
+        # Transposition permütasyonu ve tersi bir kez ayrıştırılır
+        self._trans_order = np.asarray(self._parse_trans_key(), dtype=np.intp)
+        self._trans_inverse = np.argsort(self._trans_order)
+        
+        # Paketlenmiş anahtar akışı döngüsü (ilk kullanımda veya prepare ile)
+        self._cycle = None
+    
+    def prepare(self) -> 'CollatzCrypto':
+        """
+        Anahtar akışı döngüsünü hemen hesaplayıp örneğe bağla.
+        
+        Hazırlanmış bir örnek, modül düzeyindeki döngü önbelleğinden
+        bağımsız olarak ilk şifrelemede hiçbir kurulum işi yapmaz.
+        
+        Returns:
+            Örneğin kendisi
+        """
+        if self._cycle is None:
+            self._cycle = np.frombuffer(_packed_collatz_cycle(self.seed), dtype=np.uint8)
+        return self
+    
+    def _kernel_window(self) -> int:
+        """Birleşik çekirdek penceresi: _KERNEL_WINDOW'a yakın bir blok katı."""
+        key_len = len(self._trans_order)
+        return max(key_len, _KERNEL_WINDOW // key_len * key_len)
     
     # ==================== COLLATZ DİZİSİ ÜRETİMİ ====================
     
@@ -66,21 +409,19 @@ class CollatzCrypto:
             0 ve 1'lerden oluşan bit listesi
         """
         bits = []
-        current = n
         
-        while len(bits) < length:
-            if current == 1:
-                # 1'e ulaştık, seed'i yeniden başlat
-                current = self.seed
-            
-            if current % 2 == 0:
-                bits.append(0)  # Çift → 0
-                current = current // 2
-            else:
-                bits.append(1)  # Tek → 1
-                current = 3 * current + 1
+        # Seed'den farklı bir başlangıç için 1'e kadar olan ön ek
+        if n != self.seed:
+            bits = [int(c) for c in _collatz_parity(n, length)[:length]]
+        
+        # 1'e ulaştıktan sonra dizi seed'in periyodunu tekrarlar
+        remaining = length - len(bits)
+        if remaining > 0:
+            cycle_bits, cycle_len = _collatz_cycle(self.seed)
+            cycle = [int(c) for c in format(cycle_bits, f'0{cycle_len}b')]
+            bits.extend((cycle * (remaining // cycle_len + 1))[:remaining])
         
-        return bits[:length]
+        return bits
     
     def balance_bits(self, bits: List[int]) -> Tuple[List[int], int]:
         """
@@ -201,7 +542,7 @@ class CollatzCrypto:
         Returns:
             Şifrelenmiş veri
         """
-        return bytes([self.affine_encrypt_byte(b) for b in data])
+        return bytes(data).translate(self._affine_table)
     
     def affine_decrypt(self, data: bytes) -> bytes:
         """
@@ -213,7 +554,7 @@ class CollatzCrypto:
         Returns:
             Çözülmüş veri
         """
-        return bytes([self.affine_decrypt_byte(b) for b in data])
+        return bytes(data).translate(self._affine_inverse_table)
     
     # ==================== TRANSPOSITION CIPHER ====================
     
@@ -226,18 +567,23 @@ class CollatzCrypto:
         Returns:
             Pozisyon değiştirme dizisi
         """
-        # Anahtarı sayılara dönüştür
-        key_nums = [int(c) for c in self.trans_key]
-        
-        # Sıralama pozisyonlarını bul (0-indexed)
-        sorted_positions = []
-        sorted_key = sorted(enumerate(key_nums), key=lambda x: x[1])
+        return _transposition_order(self.trans_key)
+    
+    def _to_blocks(self, data: bytes) -> np.ndarray:
+        """
+        Veriyi sıfırlarla tamamlanmış (blok sayısı, anahtar uzunluğu) matrisine dönüştür.
         
-        result = [0] * len(key_nums)
-        for new_pos, (old_pos, _) in enumerate(sorted_key):
-            result[old_pos] = new_pos
+        Args:
+            data: Bloklara bölünecek veri
             
-        return result
+        Returns:
+            uint8 blok matrisi
+        """
+        src = np.frombuffer(data, dtype=np.uint8)
+        key_len = len(self._trans_order)
+        blocks = np.zeros(-(-len(src) // key_len) * key_len, dtype=np.uint8)
+        blocks[:len(src)] = src
+        return blocks.reshape(-1, key_len)
     
     def transpose_encrypt(self, data: bytes) -> bytes:
         """
@@ -252,144 +598,699 @@ class CollatzCrypto:
         Returns:
             Şifrelenmiş veri
         """
-        key_order = self._parse_trans_key()
-        key_len = len(key_order)
+        # Blok eksikse padding eklenir; sütunlar ters sıraya göre toplanır
+        return self._to_blocks(data)[:, self._trans_inverse].tobytes()
+    
+    def transpose_decrypt(self, data: bytes) -> bytes:
+        """
+        Transposition cipher ile şifrelenmiş veriyi çöz.
+        
+        Args:
+            data: Çözülecek veri
+            
+        Returns:
+            Çözülmüş veri
+        """
+        return self._to_blocks(data)[:, self._trans_order].tobytes()
+    
+    # ==================== XOR İŞLEMİ (Collatz ile) ====================
+    
+    def _collatz_keystream(self, length: int, offset: int = 0) -> np.ndarray:
+        """
+        Paketlenmiş Collatz periyodunu döşeyerek anahtar akışı üret.
         
-        # Veriyi bloklara böl
-        result = bytearray()
+        Maliyet mesaj boyutuyla değil periyot uzunluğuyla orantılıdır;
+        periyot her seed için bir kez hesaplanıp önbellekte tutulur.
         
-        for i in range(0, len(data), key_len):
-            block = data[i:i + key_len]
+        Args:
+            length: İstenen byte uzunluğu
+            offset: Anahtar akışında başlangıç byte konumu
             
-            # Blok eksikse padding ekle
-            if len(block) < key_len:
-                block = block + bytes([0] * (key_len - len(block)))
+        Returns:
+            Anahtar akışı (uint8 dizisi)
+        """
+        cycle = self.prepare()._cycle
+        start = offset % len(cycle)
+        if start:
+            cycle = np.concatenate((cycle[start:], cycle[:start]))
+        # np.resize kısa diziyi döngüsel olarak tekrarlayarak büyütür
+        return np.resize(cycle, length)
+    
+    def keystream(self, offset: int, length: int) -> bytes:
+        """
+        Anahtar akışının herhangi bir konumundaki byte'ları üret.
+        
+        Akış periyodik olduğundan başlangıç konumu periyoda göre mod
+        alınarak O(1) bulunur; önceki byte'lar üretilmez.
+        
+        Args:
+            offset: Başlangıç byte konumu
+            length: İstenen byte uzunluğu
             
-            # Bloğu yeniden sırala
-            new_block = [0] * key_len
-            for old_pos, new_pos in enumerate(key_order):
-                new_block[new_pos] = block[old_pos]
+        Returns:
+            Anahtar akışı byte'ları
+        """
+        return self._collatz_keystream(length, offset).tobytes()
+    
+    def xor_with_collatz(self, data: bytes, encrypt: bool = True) -> bytes:
+        """
+        Veriyi Collatz dizisinden üretilen bitlerle XOR'la.
+        
+        Args:
+            data: İşlenecek veri
+            encrypt: True ise şifreleme, False ise çözme
             
-            result.extend(new_block)
+        Returns:
+            XOR'lanmış veri
+        """
+        keystream = self._collatz_keystream(len(data))
         
-        return bytes(result)
+        # XOR işlemi (vektörel)
+        result = np.bitwise_xor(np.frombuffer(data, dtype=np.uint8), keystream)
+        return result.tobytes()
     
-    def transpose_decrypt(self, data: bytes) -> bytes:
+    # ==================== BİRLEŞİK (FUSED) ÇEKİRDEK ====================
+    
+    def _encrypt_into(self, src: np.ndarray, dst: np.ndarray, offset: int = 0) -> None:
         """
-        Transposition cipher ile şifrelenmiş veriyi çöz.
+        Düz metni tek geçişte şifreleyip hazır çıktı tamponuna yaz.
+        
+        Collatz XOR, Affine tablo araması ve blok permütasyonu pencere
+        pencere birlikte uygulanır; ara `bytes` nesnesi oluşturulmaz.
+        
+        Args:
+            src: Düz metin (uint8 dizisi)
+            dst: Çıktı tamponu (uzunluğu src'nin blok sayısı × anahtar uzunluğu)
+            offset: src[0]'ın anahtar akışındaki byte konumu
+        """
+        key_len = len(self._trans_order)
+        table = np.frombuffer(self._affine_table, dtype=np.uint8)
+        window = self._kernel_window()
+        
+        for start in range(0, len(src), window):
+            chunk = src[start:start + window]
+            padded_len = -(-len(chunk) // key_len) * key_len
+            out = dst[start:start + padded_len]
+            
+            # XOR ve Affine aynı pencere tamponunda
+            block = np.zeros(padded_len, dtype=np.uint8)
+            np.bitwise_xor(chunk, self._collatz_keystream(len(chunk), offset + start),
+                           out=block[:len(chunk)])
+            np.take(table, block[:len(chunk)], out=block[:len(chunk)], mode='clip')
+            
+            # Transposition: sütunları doğrudan çıktı tamponuna topla; anahtar
+            # genişliğinden bağımsız olarak ek indeks dizisi gerekmez
+            np.take(block.reshape(-1, key_len), self._trans_inverse, axis=1,
+                    out=out.reshape(-1, key_len), mode='clip')
+    
+    def _decrypt_into(self, src: np.ndarray, dst: np.ndarray, offset: int = 0) -> None:
+        """
+        Şifreli veriyi tek geçişte çözüp hazır çıktı tamponuna yaz.
+        
+        `_encrypt_into` işleminin ayna görüntüsüdür: blok permütasyonu,
+        ters Affine tablo araması ve Collatz XOR birlikte uygulanır.
+        
+        Args:
+            src: Şifreli veri (uint8 dizisi)
+            dst: Çıktı tamponu (en fazla src'nin bloklara tamamlanmış uzunluğu)
+            offset: dst[0]'ın anahtar akışındaki byte konumu
+        """
+        key_len = len(self._trans_order)
+        table = np.frombuffer(self._affine_inverse_table, dtype=np.uint8)
+        window = self._kernel_window()
+        
+        for start in range(0, len(dst), window):
+            out = dst[start:start + window]
+            padded_len = -(-len(out) // key_len) * key_len
+            chunk = src[start:start + padded_len]
+            
+            # Eksik son blok sıfırlarla tamamlanır
+            if len(chunk) < padded_len:
+                chunk = np.concatenate((chunk, np.zeros(padded_len - len(chunk), dtype=np.uint8)))
+            
+            block = np.take(chunk.reshape(-1, key_len), self._trans_order, axis=1).reshape(-1)[:len(out)]
+            np.take(table, block, out=block, mode='clip')
+            np.bitwise_xor(block, self._collatz_keystream(len(out), offset + start), out=out)
+    
+    def encrypt_fused(self, data: bytes) -> bytearray:
+        """
+        Byte dizisini birleşik çekirdekle şifrele.
+        
+        Sonuç, aşama aşama çalışan referans yolla (xor_with_collatz →
+        affine_encrypt → transpose_encrypt) byte byte aynıdır; ancak tek
+        bir çıktı tamponu ayrılır.
+        
+        Args:
+            data: Şifrelenecek veri
+            
+        Returns:
+            Şifrelenmiş veri (padding dahil)
+        """
+        src = np.frombuffer(data, dtype=np.uint8)
+        key_len = len(self._trans_order)
+        result = bytearray(-(-len(src) // key_len) * key_len)
+        self._encrypt_into(src, np.frombuffer(result, dtype=np.uint8))
+        return result
+    
+    def decrypt_fused(self, data: bytes, original_length: int = None) -> bytearray:
+        """
+        Byte dizisini birleşik çekirdekle çöz.
         
         Args:
             data: Çözülecek veri
+            original_length: Orijinal veri uzunluğu (padding için)
             
         Returns:
             Çözülmüş veri
         """
-        key_order = self._parse_trans_key()
-        key_len = len(key_order)
+        src = np.frombuffer(data, dtype=np.uint8)
+        key_len = len(self._trans_order)
+        length = -(-len(src) // key_len) * key_len
+        if original_length:
+            length = min(length, original_length)
+        result = bytearray(length)
+        self._decrypt_into(src, np.frombuffer(result, dtype=np.uint8))
+        return result
+    
+    def decrypt_range(self, ciphertext: bytes, start: int, length: int,
+                      original_length: int = None) -> bytes:
+        """
+        Şifreli verinin yalnızca istenen düz metin aralığını çöz.
         
-        # Ters sıralama oluştur
-        reverse_order = [0] * key_len
-        for old_pos, new_pos in enumerate(key_order):
-            reverse_order[new_pos] = old_pos
+        Sadece aralığı kapsayan transposition blokları çözülür; anahtar
+        akışı doğrudan ilgili konumdan başlatılır.
         
-        result = bytearray()
+        Args:
+            ciphertext: Şifrelenmiş veri (padding dahil)
+            start: Düz metindeki başlangıç byte konumu
+            length: İstenen byte uzunluğu
+            original_length: Orijinal veri uzunluğu (padding için)
+            
+        Returns:
+            Çözülmüş aralık (orijinal uzunluğu aşan kısım kırpılır; uzunluk
+            verilmezse yalnızca şifreli verinin sonunda kırpılır)
+        """
+        if start < 0 or length < 0:
+            raise ValueError("Başlangıç ve uzunluk negatif olamaz!")
+        
+        key_len = len(self._trans_order)
+        end = min(start + length, -(-len(ciphertext) // key_len) * key_len)
+        if original_length:
+            end = min(end, original_length)
+        if end <= start:
+            return b''
+        
+        # Aralığı kapsayan blok sınırları
+        block_start = start // key_len * key_len
+        block_end = -(-end // key_len) * key_len
+        
+        src = np.frombuffer(ciphertext, dtype=np.uint8)[block_start:block_end]
+        result = bytearray(end - block_start)
+        self._decrypt_into(src, np.frombuffer(result, dtype=np.uint8), block_start)
+        return bytes(result[start - block_start:])
+    
+    # ==================== TOPLU (BATCH) ŞİFRELEME ====================
+    
+    def encrypt_many(self, messages: Sequence[bytes]) -> List[bytes]:
+        """
+        Aynı anahtarla çok sayıda kısa mesajı tek seferde şifrele.
         
-        for i in range(0, len(data), key_len):
-            block = data[i:i + key_len]
+        Her mesaj anahtar akışının başından başladığı için ortak önek bir
+        kez üretilir. Mesajlar uzunluğa göre sıralanıp sıfırlarla
+        tamamlanmış 2B matrislere yerleştirilir; XOR, Affine ve
+        transposition tüm matrise birlikte uygulanır. Sonuçlar
+        `encrypt_bytes` ile byte byte aynıdır.
+        
+        Args:
+            messages: Düz metin mesajları
             
-            # Bloğu eski haline getir
-            new_block = [0] * key_len
-            for old_pos, new_pos in enumerate(reverse_order):
-                if old_pos < len(block):
-                    new_block[new_pos] = block[old_pos]
+        Returns:
+            Şifrelenmiş mesajlar (padding dahil, giriş sırasıyla)
+        """
+        key_len = len(self._trans_order)
+        table = np.frombuffer(self._affine_table, dtype=np.uint8)
+        lengths = np.fromiter(map(len, messages), dtype=np.int64, count=len(messages))
+        padded = -(-lengths // key_len) * key_len
+        results = [b''] * len(messages)
+        if not len(messages):
+            return results
+        
+        keystream = self._collatz_keystream(int(padded.max()))
+        order = np.argsort(lengths, kind='stable')
+        
+        # Uzunluğa göre gruplanır; kısa mesajlar uzun olanın genişliğine şişmez
+        for start in range(0, len(order), _BATCH_ROWS):
+            rows = order[start:start + _BATCH_ROWS]
+            width = int(padded[rows[-1]])
+            matrix, mask = _pack_rows([messages[i] for i in rows.tolist()], lengths[rows], width)
             
-            result.extend(new_block)
+            np.bitwise_xor(matrix, keystream[:width], out=matrix)
+            np.take(table, matrix, out=matrix, mode='clip')
+            # Transposition padding'i Affine sonrasında sıfırdır
+            matrix[~mask] = 0
+            
+            blocks = matrix.reshape(len(rows), width // key_len, key_len)
+            matrix = blocks[:, :, self._trans_inverse].reshape(len(rows), width)
+            _unpack_rows(matrix, rows, padded[rows], results)
         
-        return bytes(result)
+        return results
     
-    # ==================== XOR İŞLEMİ (Collatz ile) ====================
+    def decrypt_many(self, ciphertexts: Sequence[bytes],
+                     lengths: Sequence[int] = None) -> List[bytes]:
+        """
+        Aynı anahtarla şifrelenmiş çok sayıda mesajı tek seferde çöz.
+        
+        Args:
+            ciphertexts: Şifreli mesajlar
+            lengths: Orijinal uzunluklar (0 olan mesajlar kırpılmaz)
+            
+        Returns:
+            Çözülmüş mesajlar (giriş sırasıyla)
+        """
+        key_len = len(self._trans_order)
+        table = np.frombuffer(self._affine_inverse_table, dtype=np.uint8)
+        cipher_lengths = np.fromiter(map(len, ciphertexts), dtype=np.int64, count=len(ciphertexts))
+        padded = -(-cipher_lengths // key_len) * key_len
+        
+        out_lengths = padded
+        if lengths is not None:
+            original = np.asarray(lengths, dtype=np.int64)
+            if original.shape != padded.shape:
+                raise ValueError("Uzunluk sayısı mesaj sayısıyla aynı olmalı")
+            out_lengths = np.where(original > 0, np.minimum(padded, original), padded)
+        
+        results = [b''] * len(ciphertexts)
+        if not len(ciphertexts):
+            return results
+        
+        keystream = self._collatz_keystream(int(padded.max()))
+        order = np.argsort(padded, kind='stable')
+        
+        for start in range(0, len(order), _BATCH_ROWS):
+            rows = order[start:start + _BATCH_ROWS]
+            width = int(padded[rows[-1]])
+            matrix, _ = _pack_rows([ciphertexts[i] for i in rows.tolist()], cipher_lengths[rows], width)
+            
+            blocks = matrix.reshape(len(rows), width // key_len, key_len)
+            matrix = blocks[:, :, self._trans_order].reshape(len(rows), width)
+            np.take(table, matrix, out=matrix, mode='clip')
+            np.bitwise_xor(matrix, keystream[:width], out=matrix)
+            _unpack_rows(matrix, rows, out_lengths[rows], results)
+        
+        return results
     
-    def xor_with_collatz(self, data: bytes, encrypt: bool = True) -> bytes:
+    # ==================== AKIŞ (STREAM) ŞİFRELEME ====================
+    
+    def encrypt_stream(self, reader: BinaryIO, writer: BinaryIO,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
         """
-        Veriyi Collatz dizisinden üretilen bitlerle XOR'la.
+        İkili bir akışı sınırlı bellekle parça parça şifrele.
+        
+        Parça boyutu anahtar uzunluğunun katına yuvarlanır; böylece
+        transposition blokları parça sınırlarında bölünmez ve anahtar
+        akışı konumu parçalar arasında taşınır. Sonuç, tüm verinin tek
+        seferde şifrelenmesiyle byte byte aynıdır.
         
         Args:
-            data: İşlenecek veri
+            reader: Düz metin okuma akışı
+            writer: Şifreli veri yazma akışı
+            chunk_size: Parça boyutu (byte)
+            
+        Returns:
+            Orijinal veri uzunluğu (şifre çözme için gerekli)
+        """
+        key_len = len(self._trans_order)
+        chunk_size = max(key_len, chunk_size // key_len * key_len)
+        buffer = bytearray(chunk_size)
+        out = np.frombuffer(buffer, dtype=np.uint8)
+        offset = 0
+        
+        while True:
+            chunk = _read_exact(reader, chunk_size)
+            if not chunk:
+                break
+            
+            out_len = -(-len(chunk) // key_len) * key_len
+            self._encrypt_into(np.frombuffer(chunk, dtype=np.uint8), out[:out_len], offset)
+            writer.write(memoryview(buffer)[:out_len])
+            offset += len(chunk)
+            
+            # Eksik parça yalnızca akışın sonunda gelir
+            if len(chunk) < chunk_size:
+                break
+        
+        return offset
+    
+    def decrypt_stream(self, reader: BinaryIO, writer: BinaryIO,
+                       original_length: int = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Şifreli bir ikili akışı sınırlı bellekle parça parça çöz.
+        
+        Args:
+            reader: Şifreli veri okuma akışı
+            writer: Düz metin yazma akışı
+            original_length: Orijinal veri uzunluğu (padding için)
+            chunk_size: Parça boyutu (byte)
+            
+        Returns:
+            Yazılan byte sayısı
+        """
+        key_len = len(self._trans_order)
+        chunk_size = max(key_len, chunk_size // key_len * key_len)
+        buffer = bytearray(chunk_size)
+        out = np.frombuffer(buffer, dtype=np.uint8)
+        offset = 0
+        
+        while True:
+            chunk = _read_exact(reader, chunk_size)
+            if not chunk:
+                break
+            
+            out_len = -(-len(chunk) // key_len) * key_len
+            if original_length:
+                out_len = min(out_len, original_length - offset)
+                if out_len <= 0:
+                    break
+            
+            self._decrypt_into(np.frombuffer(chunk, dtype=np.uint8), out[:out_len], offset)
+            writer.write(memoryview(buffer)[:out_len])
+            offset += out_len
+            
+            if len(chunk) < chunk_size:
+                break
+        
+        return offset
+    
+    def encryptor(self) -> 'CipherContext':
+        """
+        Parça parça veri alan artımlı şifreleme bağlamı oluştur.
+        
+        Örnek:
+            ctx = crypto.encryptor()
+            out = ctx.update(b"parca-1") + ctx.update(b"parca-2") + ctx.finalize()
+            original_length = ctx.input_length
+        """
+        return CipherContext(self, True)
+    
+    def decryptor(self, original_length: int = None) -> 'CipherContext':
+        """
+        Parça parça şifreli veri alan artımlı çözme bağlamı oluştur.
+        
+        Args:
+            original_length: Orijinal veri uzunluğu (padding için)
+        """
+        return CipherContext(self, False, original_length)
+    
+    # ==================== BELLEK EŞLEMELİ (MMAP) DOSYA ŞİFRELEME ====================
+    
+    def _transform_mapped(self, src_path: str, dst_path: str, encrypt: bool,
+                          original_length: int = None) -> int:
+        """
+        Girdi dosyasını eşleyip önceden boyutlandırılmış çıktı eşlemesine işle.
+        
+        Birleşik çekirdek doğrudan iki eşlemenin numpy görünümleri üzerinde
+        pencere pencere çalışır; ara `bytes` nesnesi oluşturulmaz.
+        
+        Args:
+            src_path: Girdi dosyası
+            dst_path: Çıktı dosyası (üzerine yazılır)
             encrypt: True ise şifreleme, False ise çözme
+            original_length: Orijinal veri uzunluğu (yalnızca çözmede)
             
         Returns:
-            XOR'lanmış veri
+            Girdi uzunluğu (şifreleme) veya yazılan byte sayısı (çözme)
         """
-        # Her byte için 8 bit gerekli
-        needed_bits = len(data) * 8
-        collatz_bits = self.generate_collatz_sequence(self.seed, needed_bits)
-        
-        # Bitleri byte'lara dönüştür
-        collatz_bytes = []
-        for i in range(0, len(collatz_bits), 8):
-            byte_bits = collatz_bits[i:i+8]
-            byte_val = 0
-            for bit in byte_bits:
-                byte_val = (byte_val << 1) | bit
-            collatz_bytes.append(byte_val)
-        
-        # XOR işlemi
-        result = bytes([d ^ c for d, c in zip(data, collatz_bytes)])
-        return result
+        key_len = len(self._trans_order)
+        _check_distinct_paths(src_path, dst_path)
+        
+        with open(src_path, 'rb') as reader, open(dst_path, 'w+b') as writer:
+            in_len = os.fstat(reader.fileno()).st_size
+            out_len = -(-in_len // key_len) * key_len
+            if not encrypt and original_length:
+                out_len = min(out_len, original_length)
+            
+            # Çıktı son boyutuna önceden genişletilir (tail padding dahil)
+            writer.truncate(out_len)
+            
+            # Boş dosyalar eşlenemez
+            if out_len == 0:
+                return in_len if encrypt else 0
+            
+            with mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ) as in_map, \
+                    mmap.mmap(writer.fileno(), out_len) as out_map:
+                src = np.frombuffer(in_map, dtype=np.uint8)
+                dst = np.frombuffer(out_map, dtype=np.uint8)
+                try:
+                    if encrypt:
+                        self._encrypt_into(src, dst)
+                    else:
+                        self._decrypt_into(src, dst)
+                    out_map.flush()
+                finally:
+                    # Görünümler kalırsa eşleme kapatılamaz
+                    del src, dst
+        
+        return in_len if encrypt else out_len
+    
+    def encrypt_file_mmap(self, src_path: str, dst_path: str) -> int:
+        """
+        Yerel bir dosyayı bellek eşlemesi (mmap) üzerinden şifrele.
+        
+        Çıktı, transposition padding'i dahil son boyutuyla önceden
+        oluşturulur; sonuç `encrypt_stream` ile byte byte aynıdır.
+        
+        Args:
+            src_path: Şifrelenecek dosya
+            dst_path: Şifreli çıktı dosyası
+            
+        Returns:
+            Orijinal dosya uzunluğu (şifre çözme için gerekli)
+        """
+        return self._transform_mapped(src_path, dst_path, True)
+    
+    def decrypt_file_mmap(self, src_path: str, dst_path: str,
+                          original_length: int = None) -> int:
+        """
+        Şifreli bir dosyayı bellek eşlemesi (mmap) üzerinden çöz.
+        
+        Args:
+            src_path: Şifreli dosya
+            dst_path: Çözülmüş çıktı dosyası
+            original_length: Orijinal dosya uzunluğu (padding için)
+            
+        Returns:
+            Yazılan byte sayısı
+        """
+        return self._transform_mapped(src_path, dst_path, False, original_length)
+    
+    # ==================== PARALEL ŞİFRELEME ====================
+    
+    def _run_parallel(self, data: bytes, out_len: int, encrypt: bool,
+                      workers: int = None) -> bytes:
+        """
+        Veriyi blok hizalı parçalara bölüp süreç havuzunda işle.
+        
+        Args:
+            data: Girdi verisi
+            out_len: Çıktı uzunluğu
+            encrypt: True ise şifreleme, False ise çözme
+            workers: İşçi süreç sayısı (varsayılan: CPU sayısı)
+            
+        Returns:
+            İşlenmiş veri
+        """
+        workers = workers or os.cpu_count() or 1
+        key_len = len(self._trans_order)
+        # Şifrelemede girdi, çözmede çıktı aralığı bölünür
+        total = len(data) if encrypt else out_len
+        
+        chunk = max(_PARALLEL_MIN_CHUNK, -(-total // workers))
+        chunk = -(-chunk // key_len) * key_len
+        
+        params = {
+            'seed': self.seed, 'affine_a': self.affine_a, 'affine_b': self.affine_b,
+            'trans_key': self.trans_key, 'modulus': self.modulus
+        }
+        
+        in_shm = shared_memory.SharedMemory(create=True, size=len(data))
+        out_shm = shared_memory.SharedMemory(create=True, size=out_len)
+        try:
+            in_shm.buf[:len(data)] = data
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_parallel_worker, params, encrypt,
+                                    in_shm.name, len(data), out_shm.name, out_len,
+                                    start, min(start + chunk, total))
+                    for start in range(0, total, chunk)
+                ]
+                for future in futures:
+                    future.result()
+            return bytes(out_shm.buf[:out_len])
+        finally:
+            in_shm.close()
+            in_shm.unlink()
+            out_shm.close()
+            out_shm.unlink()
+    
+    def parallel_encrypt(self, data: bytes, workers: int = None) -> bytes:
+        """
+        Büyük veriyi birden fazla çekirdekte şifrele.
+        
+        Veri anahtar uzunluğuna hizalı parçalara bölünür; her parça kendi
+        anahtar akışı konumundan bağımsız olarak şifrelenir. Sonuç seri
+        yolla byte byte aynıdır.
+        
+        Args:
+            data: Şifrelenecek veri
+            workers: İşçi süreç sayısı (varsayılan: CPU sayısı)
+            
+        Returns:
+            Şifrelenmiş veri (padding dahil)
+        """
+        key_len = len(self._trans_order)
+        out_len = -(-len(data) // key_len) * key_len
+        
+        # Küçük veride süreç başlatma maliyeti kazançtan büyüktür
+        if workers == 1 or len(data) <= _PARALLEL_MIN_CHUNK:
+            return self.encrypt_fused(data)
+        return self._run_parallel(data, out_len, True, workers)
+    
+    def parallel_decrypt(self, data: bytes, original_length: int = None,
+                         workers: int = None) -> bytes:
+        """
+        Büyük şifreli veriyi birden fazla çekirdekte çöz.
+        
+        Args:
+            data: Çözülecek veri
+            original_length: Orijinal veri uzunluğu (padding için)
+            workers: İşçi süreç sayısı (varsayılan: CPU sayısı)
+            
+        Returns:
+            Çözülmüş veri
+        """
+        key_len = len(self._trans_order)
+        out_len = -(-len(data) // key_len) * key_len
+        if original_length:
+            out_len = min(out_len, original_length)
+        
+        if workers == 1 or out_len <= _PARALLEL_MIN_CHUNK:
+            return self.decrypt_fused(data, original_length)
+        return self._run_parallel(data, out_len, False, workers)
     
     # ==================== ANA ŞİFRELEME/ÇÖZME ====================
     
-    def encrypt(self, plaintext: str) -> Tuple[str, dict]:
+    def encrypt_bytes(self, data: bytes, trace: StageTrace = None) -> bytes:
         """
-        Metni tamamen şifrele.
+        Byte dizisini sessizce şifrele (çekirdek API).
         
-        Şifreleme Zinciri:
-        1. Metin → Byte'lar
-        2. Collatz XOR
-        3. Affine Cipher
-        4. Transposition
-        5. Hex çıktı
+        İz kancası verilmezse birleşik çekirdek kullanılır ve hiçbir çıktı
+        üretilmez. Kanca verilirse aşamalar tek tek çalıştırılır ve her
+        aşamadan sonra `trace(adım, etiket, veri)` çağrılır.
         
         Args:
-            plaintext: Şifrelenecek düz metin
+            data: Şifrelenecek veri
+            trace: İsteğe bağlı aşama izleme fonksiyonu (örn. print_stage)
             
         Returns:
-            (Şifrelenmiş hex string, metadata dictionary)
+            Şifrelenmiş veri (padding dahil). Kanca yoksa çekirdeğin çıktı
+            tamponu kopyalanmadan bytearray olarak döner; değişmez bytes
+            gerekiyorsa bytes(...) çıktının tamamını bir kez daha kopyalar.
         """
-        # Metin → Byte
-        data = plaintext.encode('utf-8')
-        original_length = len(data)
+        if trace is None:
+            return self.encrypt_fused(data)
         
-        print(f"[1] Orijinal veri: {data.hex()}")
+        trace(1, "Orijinal veri", data)
         
-        # Collatz XOR
         data = self.xor_with_collatz(data, encrypt=True)
-        print(f"[2] Collatz XOR sonrası: {data.hex()}")
+        trace(2, "Collatz XOR sonrası", data)
         
-        # Affine Cipher
         data = self.affine_encrypt(data)
-        print(f"[3] Affine Cipher sonrası: {data.hex()}")
+        trace(3, "Affine Cipher sonrası", data)
         
-        # Transposition
         data = self.transpose_encrypt(data)
-        print(f"[4] Transposition sonrası: {data.hex()}")
+        trace(4, "Transposition sonrası", data)
         
-        # Bit dağılımını analiz et
-        bit_string = ''.join(format(b, '08b') for b in data)
-        zeros = bit_string.count('0')
-        ones = bit_string.count('1')
+        return data
+    
+    def decrypt_bytes(self, data: bytes, original_length: int = None,
+                      trace: StageTrace = None) -> bytes:
+        """
+        Byte dizisini sessizce çöz (çekirdek API).
         
-        metadata = {
+        Args:
+            data: Çözülecek veri
+            original_length: Orijinal veri uzunluğu (padding için)
+            trace: İsteğe bağlı aşama izleme fonksiyonu (örn. print_stage)
+            
+        Returns:
+            Çözülmüş veri (kanca yoksa kopyasız bytearray; bkz. encrypt_bytes)
+        """
+        if trace is None:
+            return self.decrypt_fused(data, original_length)
+        
+        trace(1, "Şifreli veri", data)
+        
+        data = self.transpose_decrypt(data)
+        trace(2, "Transposition çözümü sonrası", data)
+        
+        data = self.affine_decrypt(data)
+        trace(3, "Affine çözümü sonrası", data)
+        
+        data = self.xor_with_collatz(data, encrypt=False)
+        trace(4, "Collatz XOR sonrası", data)
+        
+        # Orijinal uzunluğa kırp (padding'i kaldır)
+        if original_length:
+            data = data[:original_length]
+        
+        return data
+    
+    def metadata(self, ciphertext: bytes, original_length: int) -> dict:
+        """
+        Şifreli verinin bit dağılımı bilgisini hesapla.
+        
+        Args:
+            ciphertext: Şifrelenmiş veri
+            original_length: Orijinal veri uzunluğu
+            
+        Returns:
+            Metadata sözlüğü
+        """
+        zeros, ones = count_bits(ciphertext)
+        return {
             'original_length': original_length,
-            'encrypted_length': len(data),
+            'encrypted_length': len(ciphertext),
             'zeros': zeros,
             'ones': ones,
             'balance_ratio': zeros / ones if ones > 0 else float('inf')
         }
+    
+    def encrypt(self, plaintext: str, trace: StageTrace = None) -> Tuple[str, dict]:
+        """
+        Metni tamamen şifrele.
         
-        return data.hex(), metadata
+        Şifreleme Zinciri:
+        1. Metin → Byte'lar
+        2. Collatz XOR
+        3. Affine Cipher
+        4. Transposition
+        5. Hex çıktı
+        
+        Args:
+            plaintext: Şifrelenecek düz metin
+            trace: İsteğe bağlı aşama izleme fonksiyonu (örn. print_stage)
+            
+        Returns:
+            (Şifrelenmiş hex string, metadata dictionary)
+        """
+        # Metin → Byte
+        data = plaintext.encode('utf-8')
+        ciphertext = self.encrypt_bytes(data, trace=trace)
+        return ciphertext.hex(), self.metadata(ciphertext, len(data))
     
-    def decrypt(self, ciphertext_hex: str, original_length: int = None) -> str:
+    def decrypt(self, ciphertext_hex: str, original_length: int = None,
+                trace: StageTrace = None) -> str:
         """
         Şifreli metni çöz.
         
@@ -403,30 +1304,14 @@ class CollatzCrypto:
         Args:
             ciphertext_hex: Şifrelenmiş hex string
             original_length: Orijinal veri uzunluğu (padding için)
+            trace: İsteğe bağlı aşama izleme fonksiyonu (örn. print_stage)
             
         Returns:
             Çözülmüş düz metin
         """
         # Hex → Byte
         data = bytes.fromhex(ciphertext_hex)
-        
-        print(f"[1] Şifreli veri: {data.hex()}")
-        
-        # Transposition (ters)
-        data = self.transpose_decrypt(data)
-        print(f"[2] Transposition çözümü sonrası: {data.hex()}")
-        
-        # Affine Cipher (ters)
-        data = self.affine_decrypt(data)
-        print(f"[3] Affine çözümü sonrası: {data.hex()}")
-        
-        # Collatz XOR
-        data = self.xor_with_collatz(data, encrypt=False)
-        print(f"[4] Collatz XOR sonrası: {data.hex()}")
-        
-        # Orijinal uzunluğa kırp (padding'i kaldır)
-        if original_length:
-            data = data[:original_length]
+        data = self.decrypt_bytes(data, original_length, trace=trace)
         
         # Byte → Metin
         return data.decode('utf-8', errors='replace')
@@ -450,6 +1335,377 @@ class CollatzCrypto:
         }
 
 
+class CipherContext:
+    """
+    hashlib / cryptography tarzı artımlı şifreleme veya çözme bağlamı.
+    
+    `update` rastgele boyutlu parçalar alır; tamamlanan transposition
+    blokları hemen işlenip döndürülür, eksik blok bir sonraki çağrıya
+    kadar tamponda bekler. Anahtar akışı konumu çağrılar arasında
+    taşınır; tüm parçaların çıktısı tek seferde işlemeyle byte byte aynıdır.
+    `finalize` kalan eksik bloğu (şifrelemede sıfır padding ile) işler.
+    """
+    
+    def __init__(self, crypto: CollatzCrypto, encrypt: bool, original_length: int = None):
+        """
+        Args:
+            crypto: Anahtarı taşıyan şifreleme örneği
+            encrypt: True ise şifreleme, False ise çözme
+            original_length: Orijinal veri uzunluğu (yalnızca çözmede)
+        """
+        self._crypto = crypto
+        self._encrypt = encrypt
+        self._key_len = len(crypto._trans_order)
+        self._pending = b''
+        self._offset = 0
+        self._remaining = original_length if not encrypt and original_length else None
+        self._finalized = False
+        self.input_length = 0
+    
+    def _transform(self, src: np.ndarray) -> bytes:
+        """Blok hizalı (veya son, eksik) parçayı işle ve konumu ilerlet."""
+        out_len = -(-len(src) // self._key_len) * self._key_len
+        if self._remaining is not None:
+            out_len = min(out_len, self._remaining)
+            self._remaining -= out_len
+        
+        result = bytearray(out_len)
+        if self._encrypt:
+            self._crypto._encrypt_into(src, np.frombuffer(result, dtype=np.uint8), self._offset)
+        else:
+            self._crypto._decrypt_into(src, np.frombuffer(result, dtype=np.uint8), self._offset)
+        self._offset += len(src)
+        return bytes(result)
+    
+    def update(self, data: bytes) -> bytes:
+        """
+        Yeni bir parçayı işle.
+        
+        Args:
+            data: Herhangi bir boyutta veri (bytes, bytearray, memoryview)
+            
+        Returns:
+            Bu parçayla tamamlanan blokların çıktısı (boş olabilir)
+        """
+        if self._finalized:
+            raise ValueError("Bağlam zaten sonlandırıldı")
+        
+        src = np.frombuffer(data, dtype=np.uint8)
+        self.input_length += len(src)
+        pieces = []
+        
+        # Önceki çağrıdan kalan eksik blok tamamlanır
+        if self._pending:
+            need = self._key_len - len(self._pending)
+            self._pending += src[:need].tobytes()
+            src = src[need:]
+            if len(self._pending) < self._key_len:
+                return b''
+            pieces.append(self._transform(np.frombuffer(self._pending, dtype=np.uint8)))
+            self._pending = b''
+        
+        full = len(src) // self._key_len * self._key_len
+        if full:
+            pieces.append(self._transform(src[:full]))
+        self._pending = src[full:].tobytes()
+        
+        return b''.join(pieces)
+    
+    def finalize(self) -> bytes:
+        """
+        Tampondaki eksik bloğu işleyip bağlamı kapat.
+        
+        Returns:
+            Son bloğun çıktısı (şifrelemede padding dahil)
+        """
+        if self._finalized:
+            raise ValueError("Bağlam zaten sonlandırıldı")
+        self._finalized = True
+        
+        if not self._pending:
+            return b''
+        pending, self._pending = self._pending, b''
+        return self._transform(np.frombuffer(pending, dtype=np.uint8))
+
+
+class MultiKeyBatch:
+    """
+    Her kaydın kendi anahtarıyla şifrelendiği toplu işlem.
+    
+    Kayıt i, (seeds[i], affine_a[i], affine_b[i], trans_keys[i]) anahtarıyla
+    şifrelenir; sonuç aynı anahtarla kurulan CollatzCrypto'nun
+    `encrypt_bytes` çıktısıyla byte byte aynıdır. Anahtar başına örnek
+    oluşturulmaz: Affine tabloları (n, 256) matrisine, anahtar akışları
+    satır satır 2B matrise yığılır ve kayıtlar transposition anahtar
+    uzunluğuna göre otomatik olarak gruplanıp tek seferde işlenir.
+    """
+    
+    def __init__(self, seeds: Sequence[int], affine_a: Sequence[int],
+                 affine_b: Sequence[int], trans_keys: Sequence[str], modulus: int = 256):
+        """
+        Args:
+            seeds: Kayıt başına Collatz seed değerleri
+            affine_a: Kayıt başına Affine çarpanları (m ile aralarında asal)
+            affine_b: Kayıt başına Affine toplam değerleri
+            trans_keys: Kayıt başına transposition anahtarları
+            modulus: Affine cipher için mod değeri
+        """
+        n = len(seeds)
+        if not (len(affine_a) == len(affine_b) == len(trans_keys) == n):
+            raise ValueError("Tüm anahtar dizileri aynı uzunlukta olmalı")
+        if modulus > 256:
+            raise ValueError(f"Modulus ({modulus}) byte şifrelemesi için 256'dan büyük olamaz!")
+        
+        seeds = [int(seed) for seed in seeds]
+        a = np.array([int(x) % modulus for x in affine_a], dtype=np.int64)
+        b = np.array([int(x) % modulus for x in affine_b], dtype=np.int64)
+        
+        for seed in seeds:
+            if seed < 1:
+                raise ValueError(f"Collatz seed değeri ({seed}) pozitif olmalı!")
+        invalid = np.gcd(a, modulus) != 1
+        if invalid.any():
+            bad = int(np.asarray(affine_a)[invalid.argmax()])
+            raise ValueError(f"Affine 'a' değeri ({bad}) modulus ({modulus}) ile aralarında asal olmalı!")
+        
+        self.modulus = modulus
+        
+        # Kayıt başına ileri ve ters Affine tabloları: (n, 256)
+        values = np.arange(256, dtype=np.int64)
+        inverse = np.array([pow(int(x), -1, modulus) for x in a], dtype=np.int64)
+        self._tables = ((a[:, None] * values + b[:, None]) % modulus).astype(np.uint8)
+        self._inverse_tables = ((inverse[:, None] * (values - b[:, None])) % modulus).astype(np.uint8)
+        
+        # Aynı seed'i paylaşan kayıtlar tek bir anahtar akışı döngüsünü kullanır
+        unique_seeds = {}
+        self._seed_index = np.array(
+            [unique_seeds.setdefault(seed, len(unique_seeds)) for seed in seeds], dtype=np.intp
+        )
+        self._cycles = [np.frombuffer(_packed_collatz_cycle(seed), dtype=np.uint8)
+                        for seed in unique_seeds]
+        
+        # Kayıtlar transposition anahtar uzunluğuna göre gruplanır
+        orders = {}
+        groups = {}
+        for i, trans_key in enumerate(trans_keys):
+            if trans_key not in orders:
+                orders[trans_key] = _transposition_order(trans_key)
+            groups.setdefault(len(orders[trans_key]), []).append(i)
+        
+        self._groups = []
+        for key_len, rows in groups.items():
+            order = np.array([orders[trans_keys[i]] for i in rows], dtype=np.intp)
+            self._groups.append((key_len, np.array(rows, dtype=np.intp),
+                                 order, np.argsort(order, axis=1)))
+    
+    def __len__(self) -> int:
+        return len(self._seed_index)
+    
+    @classmethod
+    def from_key_strings(cls, key_strings: Sequence[str], modulus: int = 256) -> 'MultiKeyBatch':
+        """Dışa aktarılmış anahtar dizgilerinden (SEED:A:B:TRANSKEY) oluştur."""
+        generator = KeyGenerator(modulus)
+        keys = [generator.import_key(key_string) for key_string in key_strings]
+        return cls([k['collatz_seed'] for k in keys], [k['affine_a'] for k in keys],
+                   [k['affine_b'] for k in keys], [k['transposition_key'] for k in keys],
+                   modulus)
+    
+    def _keystream_rows(self, rows: np.ndarray, width: int) -> np.ndarray:
+        """Verilen kayıtların anahtar akışlarını (satır sayısı, width) matrisine yığ."""
+        ids = self._seed_index[rows]
+        unique, positions = np.unique(ids, return_inverse=True)
+        streams = np.empty((len(unique), width), dtype=np.uint8)
+        for j, seed_id in enumerate(unique.tolist()):
+            streams[j] = np.resize(self._cycles[seed_id], width)
+        return streams[positions]
+    
+    def _check_count(self, count: int):
+        if count != len(self):
+            raise ValueError(f"Kayıt sayısı ({count}) anahtar sayısıyla ({len(self)}) aynı olmalı")
+    
+    def encrypt(self, records: Sequence[bytes]) -> List[bytes]:
+        """
+        Her kaydı kendi anahtarıyla şifrele.
+        
+        Args:
+            records: Düz metin kayıtları (anahtarlarla aynı sırada)
+            
+        Returns:
+            Şifrelenmiş kayıtlar (padding dahil)
+        """
+        self._check_count(len(records))
+        lengths = np.fromiter(map(len, records), dtype=np.int64, count=len(records))
+        results = [b''] * len(records)
+        
+        for key_len, group_rows, _, inverses in self._groups:
+            padded = -(-lengths[group_rows] // key_len) * key_len
+            order = np.argsort(padded, kind='stable')
+            
+            for start in range(0, len(order), _BATCH_ROWS):
+                part = order[start:start + _BATCH_ROWS]
+                rows = group_rows[part]
+                width = int(padded[part[-1]])
+                if width == 0:
+                    continue
+                
+                matrix, mask = _pack_rows([records[i] for i in rows.tolist()], lengths[rows], width)
+                matrix ^= self._keystream_rows(rows, width)
+                matrix = np.take_along_axis(self._tables[rows], matrix, axis=1)
+                # Transposition padding'i Affine sonrasında sıfırdır
+                matrix[~mask] = 0
+                
+                blocks = matrix.reshape(len(rows), width // key_len, key_len)
+                matrix = np.take_along_axis(blocks, inverses[part][:, None, :], axis=2)
+                _unpack_rows(matrix.reshape(len(rows), width), rows, padded[part], results)
+        
+        return results
+    
+    def decrypt(self, ciphertexts: Sequence[bytes], lengths: Sequence[int] = None) -> List[bytes]:
+        """
+        Her şifreli kaydı kendi anahtarıyla çöz.
+        
+        Args:
+            ciphertexts: Şifreli kayıtlar (anahtarlarla aynı sırada)
+            lengths: Orijinal uzunluklar (0 olan kayıtlar kırpılmaz)
+            
+        Returns:
+            Çözülmüş kayıtlar
+        """
+        self._check_count(len(ciphertexts))
+        cipher_lengths = np.fromiter(map(len, ciphertexts), dtype=np.int64, count=len(ciphertexts))
+        original = None
+        if lengths is not None:
+            original = np.asarray(lengths, dtype=np.int64)
+            self._check_count(len(original))
+        results = [b''] * len(ciphertexts)
+        
+        for key_len, group_rows, orders, _ in self._groups:
+            padded = -(-cipher_lengths[group_rows] // key_len) * key_len
+            out_lengths = padded
+            if original is not None:
+                group_original = original[group_rows]
+                out_lengths = np.where(group_original > 0, np.minimum(padded, group_original), padded)
+            order = np.argsort(padded, kind='stable')
+            
+            for start in range(0, len(order), _BATCH_ROWS):
+                part = order[start:start + _BATCH_ROWS]
+                rows = group_rows[part]
+                width = int(padded[part[-1]])
+                if width == 0:
+                    continue
+                
+                matrix, _ = _pack_rows([ciphertexts[i] for i in rows.tolist()],
+                                       cipher_lengths[rows], width)
+                blocks = matrix.reshape(len(rows), width // key_len, key_len)
+                matrix = np.take_along_axis(blocks, orders[part][:, None, :], axis=2)
+                matrix = np.take_along_axis(self._inverse_tables[rows],
+                                            matrix.reshape(len(rows), width), axis=1)
+                matrix ^= self._keystream_rows(rows, width)
+                _unpack_rows(matrix, rows, out_lengths[part], results)
+        
+        return results
+
+
+class CryptoContextCache:
+    """
+    Dışa aktarılmış anahtar dizgisine (SEED:A:B:TRANSKEY) göre hazırlanmış
+    CollatzCrypto örneklerini tutan, sınırlı ve iş parçacığı güvenli LRU önbellek.
+    
+    Önbellekteki her örnek Affine tablolarını, ayrıştırılmış permütasyonları
+    ve anahtar akışı döngüsünü içerir; sık kullanılan anahtarlar hiçbir
+    kurulum işi yapmaz.
+    """
+    
+    def __init__(self, maxsize: int = 1024, modulus: int = 256):
+        if maxsize < 1:
+            raise ValueError("Önbellek boyutu en az 1 olmalı")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._generator = KeyGenerator(modulus)
+        self._contexts = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key_string: str) -> CollatzCrypto:
+        """
+        Anahtar dizgisi için hazırlanmış örneği döndür (yoksa oluştur).
+        
+        Args:
+            key_string: KeyGenerator.export_key çıktısı
+            
+        Returns:
+            Hazırlanmış CollatzCrypto örneği
+        """
+        with self._lock:
+            crypto = self._contexts.get(key_string)
+            if crypto is not None:
+                self._contexts.move_to_end(key_string)
+                self.hits += 1
+                return crypto
+            self.misses += 1
+        
+        # Kurulum kilit dışında yapılır; diğer anahtarlar beklemez
+        keyset = self._generator.import_key(key_string)
+        crypto = CollatzCrypto(
+            seed=keyset['collatz_seed'],
+            affine_a=keyset['affine_a'],
+            affine_b=keyset['affine_b'],
+            trans_key=keyset['transposition_key'],
+            modulus=keyset['modulus']
+        ).prepare()
+        
+        with self._lock:
+            # Aynı anahtarı eşzamanlı hazırlayan başka bir iş parçacığı önde olabilir
+            existing = self._contexts.get(key_string)
+            if existing is not None:
+                self._contexts.move_to_end(key_string)
+                return existing
+            
+            self._contexts[key_string] = crypto
+            if len(self._contexts) > self.maxsize:
+                self._contexts.popitem(last=False)
+                self.evictions += 1
+        
+        return crypto
+    
+    def stats(self) -> dict:
+        """İsabet/ıska/çıkarma sayaçlarını ve doluluk bilgisini döndür."""
+        with self._lock:
+            return {
+                'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._contexts), 'maxsize': self.maxsize
+            }
+    
+    def clear(self):
+        """Önbelleği boşalt (sayaçlar korunur)."""
+        with self._lock:
+            self._contexts.clear()
+    
+    def __len__(self) -> int:
+        return len(self._contexts)
+    
+    def __contains__(self, key_string: str) -> bool:
+        return key_string in self._contexts
+
+
+def _add_key_arguments(parser: argparse.ArgumentParser):
+    """Dosya komutları için ortak anahtar argümanlarını ekle."""
+    parser.add_argument('--seed', type=int, default=27,
+                        help='Collatz seed değeri (varsayılan: 27)')
+    parser.add_argument('--affine-a', type=int, default=5,
+                        help='Affine çarpan (varsayılan: 5)')
+    parser.add_argument('--affine-b', type=int, default=8,
+                        help='Affine toplam (varsayılan: 8)')
+    parser.add_argument('--trans-key', type=str, default='3142',
+                        help='Transposition anahtarı, uzunsa virgülle ayrılmış (varsayılan: 3142)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Akış parça boyutu, byte (varsayılan: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--mmap', action='store_true',
+                        help='Akış yerine bellek eşlemesi (mmap) kullan')
+
+
 def main():
     """Ana program giriş noktası."""
     parser = argparse.ArgumentParser(
@@ -463,6 +1719,11 @@ def main():
 
   Şifre Çözme:
     python collatz_crypto.py decrypt "HEXSTRING" --original-length 13
+
+  Dosya Şifreleme:
+    python collatz_crypto.py encrypt-file arsiv.log arsiv.enc --seed 42
+    python collatz_crypto.py decrypt-file arsiv.enc arsiv.log --seed 42 --original-length 1048576
+    python collatz_crypto.py encrypt-file arsiv.log arsiv.enc --seed 42 --mmap
         """
     )
     
@@ -494,6 +1755,19 @@ def main():
     decrypt_parser.add_argument('--original-length', type=int,
                                 help='Orijinal veri uzunluğu')
     
+    # Dosya şifreleme komutları
+    encrypt_file_parser = subparsers.add_parser('encrypt-file', help='Dosya şifrele (akış)')
+    encrypt_file_parser.add_argument('input', help='Şifrelenecek dosya')
+    encrypt_file_parser.add_argument('output', help='Şifreli çıktı dosyası')
+    _add_key_arguments(encrypt_file_parser)
+    
+    decrypt_file_parser = subparsers.add_parser('decrypt-file', help='Dosya şifresini çöz (akış)')
+    decrypt_file_parser.add_argument('input', help='Şifreli dosya')
+    decrypt_file_parser.add_argument('output', help='Çözülmüş çıktı dosyası')
+    _add_key_arguments(decrypt_file_parser)
+    decrypt_file_parser.add_argument('--original-length', type=int,
+                                     help='Orijinal dosya uzunluğu')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -521,7 +1795,7 @@ def main():
             print(f"\n📝 Orijinal Metin: {args.text}")
             print("\n🔄 Şifreleme Adımları:")
             
-            ciphertext, metadata = crypto.encrypt(args.text)
+            ciphertext, metadata = crypto.encrypt(args.text, trace=print_stage)
             
             print(f"\n🔒 Şifreli Metin (Hex): {ciphertext}")
             print(f"\n📊 Metadata:")
@@ -534,11 +1808,41 @@ def main():
             
             plaintext = crypto.decrypt(
                 args.ciphertext, 
-                original_length=args.original_length
+                original_length=args.original_length,
+                trace=print_stage
             )
             
             print(f"\n📝 Çözülmüş Metin: {plaintext}")
         
+        elif args.command == 'encrypt-file':
+            _check_distinct_paths(args.input, args.output)
+            if args.mmap:
+                original_length = crypto.encrypt_file_mmap(args.input, args.output)
+            else:
+                with open(args.input, 'rb') as reader, open(args.output, 'wb') as writer:
+                    original_length = crypto.encrypt_stream(reader, writer, chunk_size=args.chunk_size)
+            
+            print(f"\n📂 {args.input} → {args.output}")
+            print(f"📏 Orijinal uzunluk: {original_length} byte "
+                  f"(çözme için --original-length {original_length})")
+        
+        elif args.command == 'decrypt-file':
+            _check_distinct_paths(args.input, args.output)
+            if args.mmap:
+                written = crypto.decrypt_file_mmap(
+                    args.input, args.output, original_length=args.original_length
+                )
+            else:
+                with open(args.input, 'rb') as reader, open(args.output, 'wb') as writer:
+                    written = crypto.decrypt_stream(
+                        reader, writer,
+                        original_length=args.original_length,
+                        chunk_size=args.chunk_size
+                    )
+            
+            print(f"\n📂 {args.input} → {args.output}")
+            print(f"📏 Yazılan: {written} byte")
+        
         print("\n" + "="*60)
         
     except Exception as e:
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Collatz Şifreleme Sunucusu
+==========================
+CollatzCrypto'yu uzun ömürlü bir asyncio sunucusu olarak sunar. İstemciler
+TCP veya Unix soketi üzerinden çerçevelenmiş şifreleme/çözme istekleri
+gönderir; her mesaj için yorumlayıcı başlatma ve numpy içe aktarma maliyeti
+ödenmez.
+
+İstek çerçevesi (big-endian, 15 byte başlık):
+
+    op (u8) | request_id (u32) | key_len (u16) | payload_len (u32) | original_length (u32)
+    ardından key_len byte anahtar dizgisi (SEED:A:B:TRANSKEY) ve payload
+
+Yanıt çerçevesi (big-endian, 13 byte başlık):
+
+    status (u8) | request_id (u32) | original_length (u32) | payload_len (u32)
+    ardından payload (hata durumunda UTF-8 hata mesajı)
+
+Bir bağlantı üzerinden yanıt beklemeden art arda istek gönderilebilir
+(pipelining); yanıtlar request_id ile eşleştirilir ve sırası farklı olabilir.
+
+Örnek:
+    python crypto_server.py serve --port 9600
+    python crypto_server.py bench --port 9600 --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from collatz_crypto import CryptoContextCache
+
+
+OP_ENCRYPT = 1
+OP_DECRYPT = 2
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+REQUEST_HEADER = struct.Struct('>BIHII')
+RESPONSE_HEADER = struct.Struct('>BIII')
+
+# Bu boyutun üzerindeki yükler olay döngüsü dışında işlenir (byte)
+DEFAULT_LARGE_PAYLOAD = 64 << 10
+
+# Bağlantı başına aynı anda işlenen en fazla istek
+DEFAULT_MAX_INFLIGHT = 256
+
+# Tek bir isteğin kabul edilen en büyük yükü (byte)
+MAX_PAYLOAD = 256 << 20
+
+
+def pack_request(op: int, request_id: int, key_string: str, payload: bytes,
+                 original_length: int = 0) -> bytes:
+    """İstek çerçevesi oluştur."""
+    key = key_string.encode('ascii')
+    return REQUEST_HEADER.pack(op, request_id, len(key), len(payload), original_length) + key + payload
+
+
+class CryptoServer:
+    """
+    Çerçevelenmiş şifreleme isteklerini işleyen asyncio sunucusu.
+
+    Anahtarlar CryptoContextCache üzerinden hazırlanmış örneklere eşlenir.
+    Küçük yükler doğrudan olay döngüsünde (mikrosaniyeler içinde), büyük
+    yükler iş parçacığı havuzunda işlenir; böylece döngü hiç bloklanmaz.
+    """
+
+    def __init__(self, cache_size: int = 1024,
+                 large_payload: int = DEFAULT_LARGE_PAYLOAD,
+                 max_inflight: int = DEFAULT_MAX_INFLIGHT,
+                 workers: int = None):
+        self.contexts = CryptoContextCache(maxsize=cache_size)
+        self.large_payload = large_payload
+        self.max_inflight = max_inflight
+        self._executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self._server = None
+        self._connections = set()
+        self.requests = 0
+        self.errors = 0
+
+    def process(self, op: int, key_string: str, payload: bytes,
+                original_length: int) -> Tuple[int, bytes]:
+        """
+        Tek bir isteği işle.
+
+        Returns:
+            (orijinal uzunluk, sonuç verisi)
+        """
+        crypto = self.contexts.get(key_string)
+        if op == OP_ENCRYPT:
+            return len(payload), crypto.encrypt_bytes(payload)
+        if op == OP_DECRYPT:
+            result = crypto.decrypt_bytes(payload, original_length or None)
+            return len(result), result
+        raise ValueError(f"Bilinmeyen işlem kodu: {op}")
+
+    async def _respond(self, writer: asyncio.StreamWriter, request_id: int,
+                       op: int, key_string: str, payload: bytes, original_length: int,
+                       slots: asyncio.Semaphore):
+        """İsteği (gerekirse havuzda) işleyip yanıtı yaz."""
+        try:
+            if len(payload) > self.large_payload:
+                loop = asyncio.get_running_loop()
+                length, result = await loop.run_in_executor(
+                    self._executor, self.process, op, key_string, payload, original_length
+                )
+            else:
+                length, result = self.process(op, key_string, payload, original_length)
+            status = STATUS_OK
+        except Exception as e:
+            self.errors += 1
+            status, length, result = STATUS_ERROR, 0, str(e).encode('utf-8')
+        finally:
+            slots.release()
+
+        self.requests += 1
+        # Başlık ve yük arada await olmadan yazılır; yanıtlar karışmaz
+        writer.write(RESPONSE_HEADER.pack(status, request_id, length, len(result)))
+        writer.write(result)
+        await writer.drain()
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter):
+        """Bir bağlantıdaki art arda gelen istekleri oku ve işle."""
+        slots = asyncio.Semaphore(self.max_inflight)
+        pending = set()
+        connection = asyncio.current_task()
+        self._connections.add(connection)
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST_HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+
+                op, request_id, key_len, payload_len, original_length = REQUEST_HEADER.unpack(header)
+                if payload_len > MAX_PAYLOAD:
+                    # Çerçeve sınırı kaybolduğu için bağlantı kapatılır
+                    break
+                key_string = (await reader.readexactly(key_len)).decode('ascii', errors='replace')
+                payload = await reader.readexactly(payload_len)
+
+                # Bağlantı başına eşzamanlı istek sınırı (geri basınç)
+                await slots.acquire()
+                task = asyncio.create_task(self._respond(
+                    writer, request_id, op, key_string, payload, original_length, slots
+                ))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Sunucu kapanırken açık bağlantılar iptal edilir; görev iptal
+            # durumunda biterse asyncio geri çağrısı hata izi basar
+            pass
+        finally:
+            self._connections.discard(connection)
+            for task in pending:
+                task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+
+    async def start(self, host: str = '127.0.0.1', port: int = None, path: str = None):
+        """TCP (host/port) veya Unix soketi (path) üzerinde dinlemeye başla."""
+        if path:
+            self._server = await asyncio.start_unix_server(self.handle_connection, path=path)
+        else:
+            self._server = await asyncio.start_server(self.handle_connection, host, port)
+        return self._server
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    def close(self):
+        """Dinlemeyi bırak (açık bağlantıları beklemeden)."""
+        if self._server is not None:
+            self._server.close()
+        self._executor.shutdown(wait=False)
+
+    async def aclose(self):
+        """Dinlemeyi bırak, açık bağlantıları kapat ve sunucunun kapanmasını bekle."""
+        if self._server is not None:
+            self._server.close()
+            for connection in list(self._connections):
+                connection.cancel()
+            if self._connections:
+                await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+
+class CryptoClient:
+    """
+    Pipelining destekleyen asyncio istemcisi.
+
+    Her istek benzersiz bir request_id alır; tek bir okuma görevi gelen
+    yanıtları bekleyen Future'lara dağıtır.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._waiting: Dict[int, asyncio.Future] = {}
+        self._reader_task = asyncio.create_task(self._read_responses())
+
+    @classmethod
+    async def connect(cls, host: str = '127.0.0.1', port: int = None,
+                      path: str = None) -> 'CryptoClient':
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _read_responses(self):
+        try:
+            while True:
+                header = await self._reader.readexactly(RESPONSE_HEADER.size)
+                status, request_id, length, payload_len = RESPONSE_HEADER.unpack(header)
+                payload = await self._reader.readexactly(payload_len)
+
+                future = self._waiting.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if status == STATUS_OK:
+                    future.set_result((payload, length))
+                else:
+                    future.set_exception(ValueError(payload.decode('utf-8', errors='replace')))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Bağlantı kapandı: {e}"))
+            self._waiting.clear()
+
+    async def request(self, op: int, key_string: str, payload: bytes,
+                      original_length: int = 0) -> Tuple[bytes, int]:
+        """
+        İstek gönder ve yanıtı bekle.
+
+        Returns:
+            (sonuç verisi, orijinal uzunluk)
+        """
+        request_id = next(self._ids) & 0xFFFFFFFF
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(pack_request(op, request_id, key_string, payload, original_length))
+        await self._writer.drain()
+        return await future
+
+    async def encrypt(self, key_string: str, data: bytes) -> Tuple[bytes, int]:
+        """Veriyi şifrele; (şifreli veri, orijinal uzunluk) döndürür."""
+        return await self.request(OP_ENCRYPT, key_string, data)
+
+    async def decrypt(self, key_string: str, ciphertext: bytes,
+                      original_length: int = 0) -> bytes:
+        """Şifreli veriyi çöz."""
+        result, _ = await self.request(OP_DECRYPT, key_string, ciphertext, original_length)
+        return result
+
+    async def close(self):
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._reader_task.cancel()
+
+
+async def run_load(host: str = '127.0.0.1', port: int = None, path: str = None,
+                   key_string: str = '27:5:8:3142', requests: int = 10000,
+                   concurrency: int = 64, size: int = 256, op: str = 'encrypt') -> Dict:
+    """
+    Sunucuya yük uygula ve verim/gecikme istatistiklerini ölç.
+
+    Args:
+        host, port, path: Sunucu adresi (path verilirse Unix soketi)
+        key_string: Kullanılacak anahtar (SEED:A:B:TRANSKEY)
+        requests: Toplam istek sayısı
+        concurrency: Aynı bağlantı üzerinde bekleyen en fazla istek
+        size: İstek yükü boyutu (byte)
+        op: 'encrypt' veya 'decrypt'
+
+    Returns:
+        İstek/saniye ve gecikme yüzdelikleri
+    """
+    client = await CryptoClient.connect(host, port, path)
+    data = os.urandom(size)
+
+    if op == 'decrypt':
+        payload, original_length = await client.encrypt(key_string, data)
+        call = lambda: client.decrypt(key_string, payload, original_length)
+    else:
+        call = lambda: client.encrypt(key_string, data)
+
+    latencies = np.empty(requests)
+    counter = itertools.count()
+
+    async def worker():
+        while True:
+            i = next(counter)
+            if i >= requests:
+                return
+            start = time.perf_counter()
+            await call()
+            latencies[i] = time.perf_counter() - start
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter() - started
+    await client.close()
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e6
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'size': size,
+        'op': op,
+        'elapsed_s': elapsed,
+        'requests_per_s': requests / elapsed,
+        'mb_per_s': requests * size / elapsed / 1e6,
+        'latency_us': {
+            'mean': float(latencies.mean() * 1e6),
+            'p50': float(p50), 'p90': float(p90), 'p99': float(p99),
+            'max': float(latencies.max() * 1e6),
+        }
+    }
+
+
+def _add_address_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--host', default='127.0.0.1', help='TCP adresi (varsayılan: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=9600, help='TCP portu (varsayılan: 9600)')
+    parser.add_argument('--unix', metavar='PATH', help='TCP yerine Unix soketi kullan')
+
+
+async def _serve(args):
+    server = CryptoServer(cache_size=args.cache_size, large_payload=args.large_payload,
+                          workers=args.workers)
+    await server.start(args.host, args.port, args.unix)
+    address = args.unix or f"{args.host}:{args.port}"
+    print(f"[INFO] Sunucu dinliyor: {address}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Collatz şifreleme sunucusu ve yük üreteci')
+    subparsers = parser.add_subparsers(dest='command', help='Komut seçin')
+
+    serve_parser = subparsers.add_parser('serve', help='Sunucuyu başlat')
+    _add_address_arguments(serve_parser)
+    serve_parser.add_argument('--cache-size', type=int, default=1024,
+                              help='Hazır anahtar önbelleği boyutu (varsayılan: 1024)')
+    serve_parser.add_argument('--large-payload', type=int, default=DEFAULT_LARGE_PAYLOAD,
+                              help=f'Havuza aktarma eşiği, byte (varsayılan: {DEFAULT_LARGE_PAYLOAD})')
+    serve_parser.add_argument('--workers', type=int,
+                              help='İş parçacığı sayısı (varsayılan: CPU sayısı)')
+
+    bench_parser = subparsers.add_parser('bench', help='Sunucuya yük uygula')
+    _add_address_arguments(bench_parser)
+    bench_parser.add_argument('--key', default='27:5:8:3142',
+                              help='Anahtar dizgisi SEED:A:B:TRANSKEY (varsayılan: 27:5:8:3142)')
+    bench_parser.add_argument('--requests', type=int, default=10000,
+                              help='Toplam istek sayısı (varsayılan: 10000)')
+    bench_parser.add_argument('--concurrency', type=int, default=64,
+                              help='Bekleyen en fazla istek (varsayılan: 64)')
+    bench_parser.add_argument('--size', type=int, default=256,
+                              help='Yük boyutu, byte (varsayılan: 256)')
+    bench_parser.add_argument('--op', choices=['encrypt', 'decrypt'], default='encrypt',
+                              help='İşlem (varsayılan: encrypt)')
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        try:
+            asyncio.run(_serve(args))
+        except KeyboardInterrupt:
+            print("\n[INFO] Sunucu durduruldu.")
+    elif args.command == 'bench':
+        stats = asyncio.run(run_load(
+            args.host, args.port, args.unix, key_string=args.key,
+            requests=args.requests, concurrency=args.concurrency,
+            size=args.size, op=args.op
+        ))
+        latency = stats['latency_us']
+        print(f"İstek: {stats['requests']}  eşzamanlı: {stats['concurrency']}  "
+              f"boyut: {stats['size']} B  işlem: {stats['op']}")
+        print(f"Verim: {stats['requests_per_s']:.0f} istek/s  ({stats['mb_per_s']:.2f} MB/s)")
+        print(f"Gecikme (us): ort={latency['mean']:.1f}  p50={latency['p50']:.1f}  "
+              f"p90={latency['p90']:.1f}  p99={latency['p99']:.1f}  max={latency['max']:.1f}")
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İkili Çerçeve (Frame) Formatı
+=============================
+Çok sayıda kısa şifreli mesajı hex kodlaması ve ayrı metadata olmadan
+taşımak için kompakt ikili format.
+
+Çerçeve yapısı (big-endian, 11 byte başlık):
+
+    +---------+--------+-----------------+---------+----------------------+
+    | version | key_id | original_length | padding | ciphertext (ham)     |
+    |  u8     |  u32   |  u32            |  u16    | original + padding   |
+    +---------+--------+-----------------+---------+----------------------+
+
+Çerçeveler bir tampona veya dosyaya art arda yazılır; okurken yük
+(payload) kopyalanmadan memoryview dilimi olarak döndürülür.
+"""
+
+import struct
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Tuple, Union
+
+from collatz_crypto import CollatzCrypto
+
+
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct('>BIIH')
+
+
+class Frame(NamedTuple):
+    """Çözümlenmiş çerçeve; payload kaynak tampona bir görünümdür."""
+    version: int
+    key_id: int
+    original_length: int
+    padding: int
+    payload: memoryview
+
+
+def _frame_header(original_length: int, ciphertext: bytes, key_id: int) -> bytes:
+    """Şifreli veri için çerçeve başlığını oluştur."""
+    padding = len(ciphertext) - original_length
+    if padding < 0:
+        raise ValueError("Şifreli veri orijinal uzunluktan kısa olamaz")
+    return FRAME_HEADER.pack(FRAME_VERSION, key_id, original_length, padding)
+
+
+def pack_frame(key_id: int, original_length: int, ciphertext: bytes) -> bytes:
+    """
+    Tek bir şifreli mesajı çerçevele.
+
+    Args:
+        key_id: Anahtar kimliği (0 - 2^32-1)
+        original_length: Düz metin uzunluğu
+        ciphertext: Ham şifreli veri (transposition padding'i dahil)
+
+    Returns:
+        Başlık + şifreli veri
+    """
+    return _frame_header(original_length, ciphertext, key_id) + ciphertext
+
+
+def pack_messages(frames: Iterable[Tuple[int, int, bytes]],
+                  out: BinaryIO = None) -> Union[bytes, int]:
+    """
+    Çok sayıda çerçeveyi art arda bir tampona veya dosyaya yaz.
+
+    Args:
+        frames: (key_id, original_length, ciphertext) üçlüleri
+        out: Yazma akışı; verilmezse tek bir bytes döndürülür
+
+    Returns:
+        out verilmezse paketlenmiş tampon, verilirse yazılan byte sayısı
+    """
+    if out is None:
+        parts = []
+        for key_id, original_length, ciphertext in frames:
+            parts.append(_frame_header(original_length, ciphertext, key_id))
+            parts.append(ciphertext)
+        return b''.join(parts)
+
+    # Akışa her çerçeve üretildiği anda yazılır; bellek toplu boyutla büyümez
+    written = 0
+    for key_id, original_length, ciphertext in frames:
+        written += out.write(_frame_header(original_length, ciphertext, key_id))
+        written += out.write(ciphertext)
+    return written
+
+
+def unpack_messages(buffer) -> Iterator[Frame]:
+    """
+    Art arda yazılmış çerçeveleri kopyalamadan dolaş.
+
+    Args:
+        buffer: bytes, bytearray, memoryview veya mmap (dosyalar için)
+
+    Yields:
+        Frame (payload kaynak tampona bir memoryview dilimidir)
+    """
+    view = memoryview(buffer)
+    offset = 0
+    header_size = FRAME_HEADER.size
+
+    while offset < len(view):
+        if offset + header_size > len(view):
+            raise ValueError(f"Eksik çerçeve başlığı (konum {offset})")
+
+        version, key_id, original_length, padding = FRAME_HEADER.unpack_from(view, offset)
+        if version != FRAME_VERSION:
+            raise ValueError(f"Desteklenmeyen çerçeve sürümü: {version}")
+
+        start = offset + header_size
+        end = start + original_length + padding
+        if end > len(view):
+            raise ValueError(f"Eksik çerçeve verisi (konum {offset})")
+
+        yield Frame(version, key_id, original_length, padding, view[start:end])
+        offset = end
+
+
+def encrypt_frame(crypto: CollatzCrypto, data: bytes, key_id: int = 0) -> bytes:
+    """Veriyi şifreleyip tek bir çerçeve olarak döndür."""
+    return pack_frame(key_id, len(data), crypto.encrypt_bytes(data))
+
+
+def encrypt_messages(crypto: CollatzCrypto, messages: Iterable[bytes], key_id: int = 0,
+                     out: BinaryIO = None) -> Union[bytes, int]:
+    """
+    Mesajları aynı anahtarla şifreleyip art arda çerçevele.
+
+    Args:
+        crypto: Şifreleme örneği
+        messages: Düz metin mesajları
+        key_id: Tüm çerçevelere yazılacak anahtar kimliği
+        out: Yazma akışı; verilmezse tek bir bytes döndürülür
+    """
+    return pack_messages(
+        ((key_id, len(message), crypto.encrypt_bytes(message)) for message in messages),
+        out
+    )
+
+
+def decrypt_frame(crypto: CollatzCrypto, frame: Frame) -> bytes:
+    """Çerçeveyi çöz; padding başlıktaki orijinal uzunluğa göre kırpılır."""
+    return crypto.decrypt_bytes(frame.payload, frame.original_length)
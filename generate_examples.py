@@ -11,7 +11,7 @@ import os
 
 # Ana modulu import et
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from collatz_crypto import CollatzCrypto
+from collatz_crypto import CollatzCrypto, print_stage
 from key_generator import KeyGenerator
 
 
@@ -104,8 +104,8 @@ def run_examples():
         
         # Simdi cozum
         log(f"\n[SIFRE COZME]")
-        decrypted = crypto.decrypt(ciphertext, original_length=len(text))
-        decrypted = decrypted.strip()  # Print olmadan
+        decrypted = crypto.decrypt(ciphertext, original_length=len(text), trace=print_stage)
+        decrypted = decrypted.strip()
         
         # Dogrulama
         if decrypted == text:
@@ -169,23 +169,18 @@ def run_without_print():
     ]
     
     for text in test_texts:
-        # Sifrele (print'leri gizle)
+        # Sifrele (iz kancasi olmadan sessiz calisir)
         data = text.encode('utf-8')
-        original_length = len(data)
-        
-        data = crypto.xor_with_collatz(data)
-        data = crypto.affine_encrypt(data)
-        data = crypto.transpose_encrypt(data)
-        ciphertext = data.hex()
+        encrypted = crypto.encrypt_bytes(data)
         
         # Bit analizi
-        bit_string = ''.join(format(b, '08b') for b in data)
-        zeros = bit_string.count('0')
-        ones = bit_string.count('1')
+        metadata = crypto.metadata(encrypted, len(data))
+        zeros = metadata['zeros']
+        ones = metadata['ones']
         
         results.append({
             'plaintext': text,
-            'ciphertext': ciphertext,
+            'ciphertext': encrypted.hex(),
             'zeros': zeros,
             'ones': ones,
             'balance': zeros/ones if ones > 0 else 0
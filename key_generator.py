@@ -6,10 +6,73 @@ Anahtar Üreteci (Key Generator)
 Collatz tabanlı kriptografik algoritma için güvenli anahtar üretimi.
 """
 
-import random
 import math
 import secrets
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Iterable, List
+
+import numpy as np
+
+
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+# 3x+1 adımının int64'te taşmadan uygulanabileceği en büyük değer
+_INT64_STEP_LIMIT = (_INT64_MAX - 1) // 3
+
+
+def _secure_randbelow(bound: int, size: int) -> np.ndarray:
+    """
+    [0, bound) aralığında `size` adet kriptografik rastgele sayı üret.
+    
+    64 bitlik rastgele değerlerin mod alınmasından doğan sapma en fazla
+    bound / 2^64 olup pratikte ihmal edilebilir.
+    """
+    raw = np.frombuffer(secrets.token_bytes(8 * size), dtype=np.uint64)
+    return (raw % np.uint64(bound)).astype(np.int64)
+
+
+def _secure_seed_candidates(min_val: int, max_val: int, size: int) -> np.ndarray:
+    """
+    [min_val, max_val) aralığında `size` adet rastgele seed adayı üret.
+    
+    Aralık int64'e sığıyorsa vektörel yol kullanılır; daha büyük seed'ler
+    Python tamsayıları olarak object dizisinde döndürülür.
+    """
+    if max_val - 1 <= _INT64_MAX:
+        return _secure_randbelow(max_val - min_val, size) + min_val
+    return np.array([secrets.randbelow(max_val - min_val) + min_val for _ in range(size)],
+                    dtype=object)
+
+
+def _collatz_seed_stats(seed: int, bits_needed: int) -> Tuple[int, int, int]:
+    """
+    Tek bir seed için istatistikleri Python tamsayılarıyla hesapla.
+    
+    int64 sınırını aşan yörüngeler için taşma güvenli yedek yoldur.
+    
+    Returns:
+        (ilk bits_needed bitteki 1 sayısı, periyot uzunluğu, en büyük değer)
+    """
+    ones = 0
+    cycle_length = 0
+    peak = seed
+    current = seed
+    steps = 0
+    
+    while steps < bits_needed or cycle_length == 0:
+        if current == 1:
+            current = seed
+        if current % 2 == 0:
+            current = current // 2
+        else:
+            if steps < bits_needed:
+                ones += 1
+            current = 3 * current + 1
+        steps += 1
+        peak = max(peak, current)
+        if cycle_length == 0 and current == 1:
+            cycle_length = steps
+    
+    return ones, cycle_length, peak
 
 
 class KeyGenerator:
@@ -47,6 +110,108 @@ class KeyGenerator:
             'ones': ones, 'balance_ratio': zeros / ones if ones > 0 else float('inf')
         }
     
+    def analyze_collatz_seeds(self, seeds: Iterable[int], bits_needed: int = 256) -> Dict[str, np.ndarray]:
+        """
+        Çok sayıda seed'i aynı anda analiz et (vektörel).
+        
+        Tüm seed'ler bir numpy dizisinde adım adım birlikte ilerletilir:
+        tek/çift güncellemeleri maskelerle yapılır ve 1'e ulaşan her seed
+        kendi başlangıç değerinden yeniden başlatılır. int64'e sığmayan
+        seed'ler ve yörüngeleri taşan seed'ler Python tamsayılarıyla
+        hesaplanır.
+        
+        Args:
+            seeds: Analiz edilecek seed değerleri (pozitif)
+            bits_needed: Denge analizi için üretilecek bit sayısı
+            
+        Returns:
+            Seed başına dizilerden oluşan sözlük: seed, total_bits, zeros,
+            ones, balance_ratio, cycle_length, peak
+        """
+        # Tamsayı dizileri Python listesine çevrilmeden doğrudan denetlenir
+        if (isinstance(seeds, np.ndarray) and seeds.dtype.kind in 'iu'
+                and (seeds.size == 0 or int(seeds.max()) <= _INT64_MAX)):
+            seed_list = seeds.astype(np.int64).ravel()
+            if (seed_list < 1).any():
+                raise ValueError("Collatz seed değerleri pozitif olmalı")
+            fits = seed_list <= _INT64_STEP_LIMIT
+        else:
+            seed_list = [int(seed) for seed in seeds]
+            if any(seed < 1 for seed in seed_list):
+                raise ValueError("Collatz seed değerleri pozitif olmalı")
+            fits = np.array([seed <= _INT64_STEP_LIMIT for seed in seed_list], dtype=bool)
+        
+        n = len(seed_list)
+        ones = np.zeros(n, dtype=np.int64)
+        cycle_length = np.zeros(n, dtype=np.int64)
+        peak = np.zeros(n, dtype=object)
+        
+        # int64'e sığan seed'ler vektörel yoldan geçer
+        fallback = list(np.flatnonzero(~fits))
+        
+        index = np.flatnonzero(fits)
+        if isinstance(seed_list, np.ndarray):
+            start = seed_list[index]
+        else:
+            start = np.array([seed_list[i] for i in index], dtype=np.int64)
+        current = start.copy()
+        seed_ones = np.zeros(len(index), dtype=np.int64)
+        seed_cycle = np.zeros(len(index), dtype=np.int64)
+        seed_peak = start.copy()
+        steps = 0
+        
+        while len(index) > 0:
+            # 1'e ulaşan seed'ler yeniden başlar
+            current = np.where(current == 1, start, current)
+            odd = (current & 1).astype(bool)
+            
+            # Taşacak yörüngeler yedek yola aktarılır
+            overflow = odd & (current > _INT64_STEP_LIMIT)
+            if overflow.any():
+                fallback.extend(index[overflow])
+                keep = ~overflow
+                index, start, current, odd = index[keep], start[keep], current[keep], odd[keep]
+                seed_ones, seed_cycle, seed_peak = seed_ones[keep], seed_cycle[keep], seed_peak[keep]
+            
+            if steps < bits_needed:
+                seed_ones += odd
+            current = np.where(odd, 3 * current + 1, current >> 1)
+            steps += 1
+            np.maximum(seed_peak, current, out=seed_peak)
+            seed_cycle[(seed_cycle == 0) & (current == 1)] = steps
+            
+            # Bit sayısı tamamlandıysa periyodu bulunan seed'ler bırakılır
+            if steps >= bits_needed:
+                done = seed_cycle > 0
+                if done.any():
+                    ones[index[done]] = seed_ones[done]
+                    cycle_length[index[done]] = seed_cycle[done]
+                    peak[index[done]] = seed_peak[done].tolist()
+                    keep = ~done
+                    index, start, current = index[keep], start[keep], current[keep]
+                    seed_ones, seed_cycle, seed_peak = seed_ones[keep], seed_cycle[keep], seed_peak[keep]
+        
+        for i in fallback:
+            ones[i], cycle_length[i], peak[i] = _collatz_seed_stats(int(seed_list[i]), bits_needed)
+        
+        zeros = bits_needed - ones
+        with np.errstate(divide='ignore'):
+            balance_ratio = np.where(ones > 0, zeros / np.maximum(ones, 1), np.inf)
+        
+        # Vektörel yolun tepe değerleri her zaman int64'e sığar; yalnızca yedek
+        # yoldan gelenler denetlenir
+        if not fallback or all(peak[i] <= _INT64_MAX for i in fallback):
+            peak = peak.astype(np.int64)
+        
+        return {
+            'seed': np.array(seed_list, dtype=object if fallback else np.int64),
+            'total_bits': np.full(n, bits_needed, dtype=np.int64),
+            'zeros': zeros, 'ones': ones,
+            'balance_ratio': balance_ratio,
+            'cycle_length': cycle_length,
+            'peak': peak
+        }
+    
     def generate_affine_params(self) -> Tuple[int, int]:
         """Geçerli Affine cipher parametreleri üret."""
         a = secrets.choice(self.valid_a_values)
@@ -65,16 +230,40 @@ class KeyGenerator:
         _, x, _ = extended_gcd(a % self.modulus, self.modulus)
         return (x % self.modulus + self.modulus) % self.modulus
     
+    @staticmethod
+    def parse_transposition_key(key: str) -> List[int]:
+        """
+        Transposition anahtarını sayı listesine dönüştür.
+        
+        İki biçim desteklenir: kısa anahtarlar için rakam dizisi ("3142")
+        ve 9'dan uzun permütasyonlar için virgülle ayrılmış liste
+        ("3,1,4,2" veya "10,2,...,1").
+        """
+        if ',' in key:
+            return [int(part) for part in key.split(',')]
+        if not key.isdigit():
+            raise ValueError("Anahtar rakamlardan veya virgülle ayrılmış sayılardan oluşmalı")
+        return [int(c) for c in key]
+    
+    @staticmethod
+    def format_transposition_key(nums: Iterable[int]) -> str:
+        """Permütasyonu anahtar dizgisine dönüştür (9'dan uzunsa virgülle ayrılmış)."""
+        nums = list(nums)
+        if len(nums) <= 9:
+            return ''.join(map(str, nums))
+        return ','.join(map(str, nums))
+    
     def generate_transposition_key(self, length: int = 4) -> str:
         """Rastgele transposition anahtarı üret."""
         nums = list(range(1, length + 1))
-        random.shuffle(nums)
-        return ''.join(map(str, nums))
+        secrets.SystemRandom().shuffle(nums)
+        return self.format_transposition_key(nums)
     
     def validate_transposition_key(self, key: str) -> Tuple[bool, str]:
-        if not key.isdigit():
-            return False, "Anahtar sadece rakamlardan oluşmalı"
-        nums = [int(c) for c in key]
+        try:
+            nums = self.parse_transposition_key(key)
+        except ValueError:
+            return False, "Anahtar rakamlardan veya virgülle ayrılmış sayılardan oluşmalı"
         if len(nums) != len(set(nums)):
             return False, "Rakamlar benzersiz olmalı"
         if set(nums) != set(range(1, len(nums) + 1)):
@@ -92,6 +281,110 @@ class KeyGenerator:
             'transposition_key': trans_key, 'modulus': self.modulus
         }
     
+    def generate_keysets(self, n: int, min_period: int = 32, max_imbalance: float = 0.4,
+                         trans_key_length: int = 4, bits_needed: int = 256,
+                         min_val: int = 10, max_val: int = 1000) -> np.ndarray:
+        """
+        Kalite filtresinden geçmiş çok sayıda anahtar setini toplu üret.
+        
+        Aday seed'ler toplu olarak analiz edilir; periyodu kısa veya bit
+        dengesi zayıf olanlar elenir. Tüm rastgelelik `secrets` kaynağından
+        gelir.
+        
+        Args:
+            n: Üretilecek anahtar seti sayısı
+            min_period: Kabul edilen en kısa Collatz periyodu
+            max_imbalance: Kabul edilen en büyük |0 - 1| / toplam bit oranı
+            trans_key_length: Transposition anahtar uzunluğu (9'dan uzunsa
+                virgülle ayrılmış biçim kullanılır)
+            bits_needed: Denge analizi için üretilecek bit sayısı
+            min_val, max_val: Seed aralığı [min_val, max_val); int64'ü aşan
+                aralıklarda collatz_seed alanı Python tamsayıları tutar
+            
+        Returns:
+            Alanları collatz_seed, affine_a, affine_b, affine_a_inverse,
+            transposition_key, cycle_length, balance_ratio olan numpy
+            yapılandırılmış dizisi (satırlar export_key ile uyumludur)
+        """
+        if trans_key_length < 1:
+            raise ValueError("Transposition anahtar uzunluğu en az 1 olmalı")
+        if min_val < 1:
+            raise ValueError(f"Seed alt sınırı ({min_val}) pozitif olmalı")
+        if min_val >= max_val:
+            raise ValueError(f"Geçersiz seed aralığı: min_val ({min_val}) "
+                             f"max_val'dan ({max_val}) küçük olmalı")
+        
+        # Virgüllü biçimde her konum basamak sayısı + 1 karakter kaplar
+        if trans_key_length <= 9:
+            key_width = trans_key_length
+        else:
+            key_width = sum(len(str(i)) for i in range(1, trans_key_length + 1)) + trans_key_length - 1
+        
+        # int64'ü aşan seed'ler object alanında Python tamsayısı olarak tutulur
+        seed_dtype = np.int64 if max_val - 1 <= _INT64_MAX else object
+        keysets = np.zeros(n, dtype=[
+            ('collatz_seed', seed_dtype), ('affine_a', np.int16), ('affine_b', np.int16),
+            ('affine_a_inverse', np.int16), ('transposition_key', f'U{key_width}'),
+            ('cycle_length', np.int64), ('balance_ratio', np.float64)
+        ])
+        
+        # Seed'ler: aday üret, toplu analiz et, zayıfları ele
+        filled = 0
+        empty_rounds = 0
+        while filled < n:
+            candidates = _secure_seed_candidates(min_val, max_val, max(2 * (n - filled), 64))
+            unique, inverse = np.unique(candidates, return_inverse=True)
+            stats = self.analyze_collatz_seeds(unique, bits_needed)
+            
+            imbalance = np.abs(stats['zeros'] - stats['ones']) / bits_needed
+            accepted = ((stats['cycle_length'] >= min_period) & (imbalance <= max_imbalance))[inverse]
+            chosen = inverse[accepted][:n - filled]
+            
+            if len(chosen) == 0:
+                empty_rounds += 1
+                if empty_rounds >= 100:
+                    raise ValueError("Kalite filtresini geçen seed bulunamadı; "
+                                     "min_period/max_imbalance değerlerini gevşetin")
+                continue
+            
+            rows = slice(filled, filled + len(chosen))
+            keysets['collatz_seed'][rows] = unique[chosen]
+            keysets['cycle_length'][rows] = stats['cycle_length'][chosen]
+            keysets['balance_ratio'][rows] = stats['balance_ratio'][chosen]
+            filled += len(chosen)
+        
+        # Affine parametreleri ve tersleri (tablo araması)
+        valid_a = np.array(self.valid_a_values, dtype=np.int64)
+        inverses = np.zeros(self.modulus, dtype=np.int64)
+        inverses[valid_a] = [self.mod_inverse(a) for a in self.valid_a_values]
+        
+        affine_a = valid_a[_secure_randbelow(len(valid_a), n)]
+        keysets['affine_a'] = affine_a
+        keysets['affine_b'] = _secure_randbelow(self.modulus, n)
+        keysets['affine_a_inverse'] = inverses[affine_a]
+        
+        # Transposition: rastgele anahtarlara göre sıralama ile yansız permütasyon
+        order = np.argsort(_secure_randbelow(2 ** 63, n * trans_key_length)
+                           .reshape(n, trans_key_length), axis=1)
+        if trans_key_length <= 9:
+            digits = (order + ord('1')).astype(np.uint8)
+            keysets['transposition_key'] = digits.view(f'S{trans_key_length}').ravel().astype(str)
+        else:
+            keysets['transposition_key'] = [self.format_transposition_key(row)
+                                             for row in (order + 1).tolist()]
+        
+        return keysets
+    
+    def export_keysets(self, keysets: np.ndarray) -> List[str]:
+        """Toplu üretilmiş anahtar setlerini SEED:A:B:TRANSKEY dizgilerine dönüştür."""
+        return [
+            f"{seed}:{a}:{b}:{key}"
+            for seed, a, b, key in zip(
+                keysets['collatz_seed'].tolist(), keysets['affine_a'].tolist(),
+                keysets['affine_b'].tolist(), keysets['transposition_key'].tolist()
+            )
+        ]
+    
     def export_key(self, keyset: Dict) -> str:
         return f"{keyset['collatz_seed']}:{keyset['affine_a']}:{keyset['affine_b']}:{keyset['transposition_key']}"
     
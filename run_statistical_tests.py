@@ -3,119 +3,50 @@
 """
 Istatistiksel Test Sonuclari Olusturucu
 =======================================
+
+Ornek:
+    python run_statistical_tests.py
+    python run_statistical_tests.py sweep --keysets 200 --samples 10 --output sweep.npz
+    python run_statistical_tests.py sweep --seeds 27 97 --affine 5:8 7:13 --trans-keys 3142 21
+    python run_statistical_tests.py sweep-check --samples 1000
 """
 
+import argparse
+import csv
+import itertools
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import numpy as np
-from scipy import stats
+from scipy import special
 from collatz_crypto import CollatzCrypto
+from key_generator import KeyGenerator
+from statistical_tests import (
+    bits_to_list, monobit_test, chi_square_test, runs_test, frequency_analysis,
+    run_tests_on_bytes
+)
 
 
-def bits_to_list(data):
-    bits = []
-    for byte in data:
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    return bits
-
-
-def monobit_test(bits):
-    n = len(bits)
-    ones = sum(bits)
-    zeros = n - ones
-    s_obs = abs(ones - zeros) / np.sqrt(n)
-    p_value = 2 * (1 - stats.norm.cdf(s_obs))
-    return {
-        'test_name': 'Monobit (Frekans) Testi',
-        'n': n, 'ones': ones, 'zeros': zeros,
-        's_obs': s_obs, 'p_value': p_value,
-        'passed': p_value >= 0.01
-    }
-
+# NIST SP 800-22 (4.2): anlamlilik duzeyi, beklenen gecme orani ve
+# p-degeri duzgunlugu icin esik
+ALPHA = 0.01
+UNIFORMITY_THRESHOLD = 0.0001
 
-def chi_square_test(bits, block_size=8):
-    n_blocks = len(bits) // block_size
-    if n_blocks == 0:
-        return {'test_name': 'Ki-Kare Testi', 'error': 'Yetersiz veri', 'passed': False}
-    
-    block_sums = []
-    for i in range(n_blocks):
-        block = bits[i * block_size:(i + 1) * block_size]
-        block_sums.append(sum(block))
-    
-    expected = block_size / 2
-    chi_sq = sum((obs - expected) ** 2 / expected for obs in block_sums)
-    df = n_blocks - 1
-    p_value = 1 - stats.chi2.cdf(chi_sq, df)
-    
-    return {
-        'test_name': 'Ki-Kare Testi',
-        'chi_square': chi_sq, 'degrees_of_freedom': df,
-        'p_value': p_value, 'passed': p_value >= 0.01
-    }
+# Duzgunluk testi icin NIST'in onerdigi en az ornek sayisi
+MIN_UNIFORMITY_SAMPLES = 55
 
+# Iki p-degeri ureten testler taramada ayri sutunlara bolunur; iki p-degerinin
+# minimumu duzgun dagilmadigindan tek sutunda ideal veri bile basarisiz olur
+SPLIT_P_VALUES = {
+    'Seri Test': (('p_value_1', 'P1'), ('p_value_2', 'P2')),
+    'Kümülatif Toplamlar Testi': (('p_value_forward', 'ileri'), ('p_value_backward', 'geri')),
+}
 
-def runs_test(bits):
-    n = len(bits)
-    ones = sum(bits)
-    pi = ones / n
-    
-    tau = 2 / np.sqrt(n)
-    if abs(pi - 0.5) >= tau:
-        return {
-            'test_name': 'Runs Testi',
-            'passed': False,
-            'note': 'Monobit testi basarisiz, runs testi uygulanamaz'
-        }
-    
-    runs = 1
-    for i in range(1, n):
-        if bits[i] != bits[i-1]:
-            runs += 1
-    
-    expected_runs = 2 * n * pi * (1 - pi) + 1
-    variance = 2 * n * pi * (1 - pi) * (1 - 2 * pi * (1 - pi) / n)
-    
-    if variance <= 0:
-        return {'test_name': 'Runs Testi', 'passed': True, 'note': 'Varyans hesaplanamadi'}
-    
-    std_runs = np.sqrt(abs(variance))
-    if std_runs == 0:
-        return {'test_name': 'Runs Testi', 'passed': True, 'note': 'Std sapma sifir'}
-    
-    z = (runs - expected_runs) / std_runs
-    p_value = 2 * (1 - stats.norm.cdf(abs(z)))
-    
-    return {
-        'test_name': 'Runs Testi',
-        'runs': runs, 'expected': expected_runs,
-        'z_score': z, 'p_value': p_value,
-        'passed': p_value >= 0.01
-    }
-
-
-def frequency_analysis(data):
-    freq = [0] * 256
-    for byte in data:
-        freq[byte] += 1
-    
-    n = len(data)
-    expected = n / 256
-    chi_sq = sum((f - expected) ** 2 / expected for f in freq if expected > 0)
-    df = 255
-    p_value = 1 - stats.chi2.cdf(chi_sq, df)
-    
-    non_zero = sum(1 for f in freq if f > 0)
-    
-    return {
-        'test_name': 'Byte Frekans Analizi',
-        'total_bytes': n, 'unique_bytes': non_zero,
-        'chi_square': chi_sq, 'p_value': p_value,
-        'passed': p_value >= 0.01
-    }
+# NIST SP 800-22'de yer almayan ve p-degerleri ideal veride de duzgun
+# dagilmayan testler; taramada yalnizca bilgi amacli gosterilir
+INFORMATIONAL_TESTS = ('Ki-Kare Testi', 'Runs Testi')
 
 
 def run_tests_and_save():
@@ -191,5 +122,341 @@ def run_tests_and_save():
     print(f"\n[INFO] Sonuclar 'examples/statistical_test_results.txt' dosyasina kaydedildi.")
 
 
+def build_keyset_grid(seeds, affine_pairs, trans_keys) -> np.ndarray:
+    """
+    Seed × Affine (a, b) × transposition anahtari kartezyen carpimindan
+    `KeyGenerator.generate_keysets` ile ayni yapida anahtar seti dizisi olustur.
+    """
+    generator = KeyGenerator()
+    key_len = max(len(key) for key in trans_keys)
+    grid = list(itertools.product(seeds, affine_pairs, trans_keys))
+
+    keysets = np.zeros(len(grid), dtype=[
+        ('collatz_seed', np.int64), ('affine_a', np.int16), ('affine_b', np.int16),
+        ('affine_a_inverse', np.int16), ('transposition_key', f'U{key_len}'),
+        ('cycle_length', np.int64), ('balance_ratio', np.float64)
+    ])
+    for i, (seed, (a, b), key) in enumerate(grid):
+        keyset = generator.import_key(f"{seed}:{a}:{b}:{key}")
+        keysets[i] = (seed, a, b, keyset['affine_a_inverse'], key, 0, 0.0)
+    return keysets
+
+
+def make_plaintext(kind: str, index: int, size: int) -> bytes:
+    """
+    Tarama ornegi icin duz metin uret.
+
+    counter: ardisik 32 bitlik sayac degerleri (dusuk entropili, her ornek farkli)
+    zeros:   tamami sifir
+    random:  os.urandom
+    """
+    if kind == 'zeros':
+        return bytes(size)
+    if kind == 'random':
+        return os.urandom(size)
+    words = -(-size // 4)
+    counter = np.arange(index * words, (index + 1) * words, dtype='>u4')
+    return counter.tobytes()[:size]
+
+
+def _sweep_p_value(result: dict) -> float:
+    """
+    Test sonucunun tarama p-degeri.
+
+    On kosulu saglanmayan testler (ornegin monobit basarisizken runs testi)
+    NIST SP 800-22 (2.3.4) geregi P = 0.0 sayilir; yalnizca yetersiz veri
+    gibi hatalarla uygulanamayan testler NaN olarak disarida birakilir.
+    """
+    if 'p_value' in result:
+        return result['p_value']
+    if 'error' not in result and not result.get('passed'):
+        return 0.0
+    return np.nan
+
+
+def _sweep_columns(results: list):
+    """
+    Test sonuclarini tarama sutunlarina donustur.
+
+    SPLIT_P_VALUES'taki testlerin her p-degeri kendi sutununa yazilir ve
+    ALPHA esigine gore ayri ayri gecer/kalir.
+
+    Returns:
+        (sutun adlari, p-degerleri, gecti)
+    """
+    names, p_values, passed = [], [], []
+    for r in results:
+        p_value = _sweep_p_value(r)
+        fields = SPLIT_P_VALUES.get(r['test_name'])
+        if fields is None:
+            names.append(r['test_name'])
+            p_values.append(p_value)
+            passed.append(bool(r.get('passed')))
+            continue
+        for field, label in fields:
+            # Uygulanamayan test (NaN) her iki sutunda da NaN kalir
+            column_p = r.get(field, p_value)
+            names.append(f"{r['test_name']} ({label})")
+            p_values.append(column_p)
+            passed.append(bool(column_p >= ALPHA))
+    return names, p_values, passed
+
+
+def _sweep_task(keyset: tuple, samples: int, sample_size: int, plaintext: str):
+    """
+    Tek bir anahtar seti icin tum ornekleri sifrele ve test bataryasini calistir.
+
+    Returns:
+        (sutun adlari, p-degerleri [ornek, sutun], gecti [ornek, sutun])
+    """
+    seed, affine_a, affine_b, trans_key = keyset
+    crypto = CollatzCrypto(seed=seed, affine_a=affine_a, affine_b=affine_b, trans_key=trans_key)
+
+    names = None
+    p_values = []
+    passed = []
+    for index in range(samples):
+        ciphertext = crypto.encrypt_bytes(make_plaintext(plaintext, index, sample_size))
+        # Uygulanamayan testler (yetersiz veri vb.) NaN olarak isaretlenir
+        names, row_p, row_passed = _sweep_columns(run_tests_on_bytes(ciphertext))
+        p_values.append(row_p)
+        passed.append(row_passed)
+
+    return names, np.array(p_values, dtype=np.float64), np.array(passed, dtype=bool)
+
+
+def _random_task(samples: int, sample_size: int):
+    """os.urandom ornekleri icin test bataryasini calistir (_sweep_task ile ayni cikti)."""
+    names = None
+    p_values = []
+    passed = []
+    for _ in range(samples):
+        names, row_p, row_passed = _sweep_columns(run_tests_on_bytes(os.urandom(sample_size)))
+        p_values.append(row_p)
+        passed.append(row_passed)
+
+    return names, np.array(p_values, dtype=np.float64), np.array(passed, dtype=bool)
+
+
+def summarize_sweep(p_values: np.ndarray, passed: np.ndarray):
+    """
+    Test basina gecme orani ve p-degeri duzgunlugu (NIST SP 800-22, 4.2).
+
+    Args:
+        p_values: [ornek, test] p-degerleri (NaN = uygulanamadi)
+        passed: [ornek, test] gecti bilgisi
+
+    Returns:
+        (gecme orani, kabul edilen en dusuk oran, duzgunluk p-degeri, gecerli ornek sayisi)
+    """
+    valid = ~np.isnan(p_values)
+    counts = valid.sum(axis=0)
+    proportion = np.where(counts > 0, (passed & valid).sum(axis=0) / np.maximum(counts, 1), np.nan)
+
+    # Kabul araligi: p ± 3 sqrt(p (1 - p) / m), p = 1 - alpha
+    p_hat = 1 - ALPHA
+    min_proportion = p_hat - 3 * np.sqrt(p_hat * (1 - p_hat) / np.maximum(counts, 1))
+
+    # P-degerlerinin 10 esit araliga dagilimi uzerinde ki-kare
+    uniformity = np.full(p_values.shape[1], np.nan)
+    for t in range(p_values.shape[1]):
+        column = p_values[valid[:, t], t]
+        if len(column) == 0:
+            continue
+        histogram = np.bincount(np.minimum((column * 10).astype(int), 9), minlength=10)
+        expected = len(column) / 10
+        chi_sq = np.sum((histogram - expected) ** 2 / expected)
+        uniformity[t] = special.gammaincc(9 / 2, chi_sq / 2)
+
+    return proportion, min_proportion, uniformity, counts
+
+
+def sweep_verdict(result: dict) -> np.ndarray:
+    """
+    Sutun basina tarama karari: gecme orani kabul araliginda ve p-degerleri
+    duzgun mu. Bilgi amacli testler karara katilmaz (her zaman True).
+    """
+    ok = ((result['proportion'] >= result['min_proportion'])
+          & (result['uniformity_p_value'] >= UNIFORMITY_THRESHOLD))
+    return ok | result['informational']
+
+
+def _sweep_result(test_names, p_values: np.ndarray, passed: np.ndarray) -> dict:
+    """[..., sutun] dizilerinden ozet istatistikleriyle tarama sonucu olustur."""
+    test_names = np.array(test_names)
+    flat_p = p_values.reshape(-1, len(test_names))
+    flat_passed = passed.reshape(-1, len(test_names))
+    proportion, min_proportion, uniformity, counts = summarize_sweep(flat_p, flat_passed)
+
+    informational = np.array([name in INFORMATIONAL_TESTS for name in test_names], dtype=bool)
+    return {
+        'test_names': test_names, 'informational': informational,
+        'p_values': p_values, 'passed': passed,
+        'proportion': proportion, 'min_proportion': min_proportion,
+        'uniformity_p_value': uniformity, 'sample_count': counts
+    }
+
+
+def run_sweep(keysets: np.ndarray, samples: int = 10, sample_size: int = 12500,
+              plaintext: str = 'counter', workers: int = None, output: str = None):
+    """
+    Anahtar seti izgarasi uzerinde paralel test taramasi.
+
+    Her anahtar seti bir surec havuzu gorevinde islenir; tum ornekler
+    sifrelenip NIST bataryasindan gecirilir.
+
+    Args:
+        keysets: Anahtar seti dizisi (generate_keysets / build_keyset_grid)
+        samples: Anahtar seti basina ornek sayisi
+        sample_size: Ornek boyutu (byte)
+        plaintext: Duz metin turu (counter, zeros, random)
+        workers: Islemci surec sayisi (varsayilan: CPU sayisi)
+        output: Sonuc dosyasi (.npz veya .csv)
+
+    Returns:
+        Sonuclari iceren sozluk
+    """
+    params = [
+        (int(k['collatz_seed']), int(k['affine_a']), int(k['affine_b']), str(k['transposition_key']))
+        for k in keysets
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(
+            _sweep_task, params,
+            itertools.repeat(samples), itertools.repeat(sample_size), itertools.repeat(plaintext),
+            chunksize=max(1, len(params) // (4 * (workers or os.cpu_count() or 1)))
+        ))
+
+    p_values = np.stack([o[1] for o in outcomes])   # [anahtar, ornek, sutun]
+    passed = np.stack([o[2] for o in outcomes])
+    result = _sweep_result(outcomes[0][0], p_values, passed)
+    result['keysets'] = keysets
+
+    if output:
+        save_sweep(result, output)
+
+    return result
+
+
+def check_random_baseline(samples: int = 1000, sample_size: int = 12500,
+                          workers: int = None) -> dict:
+    """
+    Tarama ozetini os.urandom verisi uzerinde calistir.
+
+    Ideal rastgele veride bilgi amacli olmayan her sutun gecmelidir; aksi
+    halde sorun sifrelemede degil test bataryasinda ya da ozettedir. Her
+    sutunun ideal veride sans eseri kalma olasiligi yaklasik %0.2'dir.
+
+    Returns:
+        run_sweep ile ayni yapida sonuc (keysets alani olmadan)
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [len(part) for part in np.array_split(np.arange(samples), 4 * workers) if len(part)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(_random_task, chunks, itertools.repeat(sample_size)))
+
+    p_values = np.concatenate([o[1] for o in outcomes])   # [ornek, sutun]
+    passed = np.concatenate([o[2] for o in outcomes])
+    return _sweep_result(outcomes[0][0], p_values, passed)
+
+
+def save_sweep(result: dict, path: str):
+    """Tarama sonuclarini .npz (tum diziler) veya .csv (ornek basina satir) olarak kaydet."""
+    if path.endswith('.csv'):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['seed', 'affine_a', 'affine_b', 'trans_key', 'sample', 'test', 'p_value', 'passed'])
+            for k, keyset in enumerate(result['keysets']):
+                for sample in range(result['p_values'].shape[1]):
+                    for t, name in enumerate(result['test_names']):
+                        writer.writerow([
+                            keyset['collatz_seed'], keyset['affine_a'], keyset['affine_b'],
+                            keyset['transposition_key'], sample, name,
+                            result['p_values'][k, sample, t], int(result['passed'][k, sample, t])
+                        ])
+    else:
+        np.savez_compressed(path, **result)
+
+
+def print_sweep_summary(result: dict):
+    """Test basina gecme orani ve duzgunluk ozetini yazdir."""
+    print("=" * 70)
+    print("TARAMA OZETI (NIST SP 800-22, 4.2)")
+    print("=" * 70)
+    if result['p_values'].ndim == 3:
+        print(f"  Anahtar seti: {result['p_values'].shape[0]}, "
+              f"ornek/anahtar: {result['p_values'].shape[1]}")
+    else:
+        print(f"  os.urandom ornegi: {result['p_values'].shape[0]}")
+    print(f"\n  {'Test':<38} {'Oran':>8} {'Min':>8} {'Duzgunluk':>10}  Sonuc")
+
+    verdict = sweep_verdict(result)
+    for t, name in enumerate(result['test_names']):
+        proportion = result['proportion'][t]
+        min_proportion = result['min_proportion'][t]
+        uniformity = result['uniformity_p_value'][t]
+        if result['informational'][t]:
+            label = 'BILGI'
+        else:
+            label = 'BASARILI' if verdict[t] else 'BASARISIZ'
+        print(f"  {name:<38} {proportion:>8.4f} {min_proportion:>8.4f} {uniformity:>10.6f}  {label}")
+
+    print(f"\n  BILGI: NIST SP 800-22 disi testler ({', '.join(INFORMATIONAL_TESTS)}); "
+          f"p-degerleri ideal veride de duzgun degildir, karara katilmaz")
+
+    few = [(name, int(count)) for name, count in zip(result['test_names'], result['sample_count'])
+           if count < MIN_UNIFORMITY_SAMPLES]
+    for name, count in few:
+        print(f"  [UYARI] {name}: duzgunluk testi {count} ornekle hesaplandi "
+              f"(NIST en az {MIN_UNIFORMITY_SAMPLES} ornek onerir)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Istatistiksel test sonuclari ve taramalar')
+    subparsers = parser.add_subparsers(dest='command')
+
+    sweep_parser = subparsers.add_parser('sweep', help='Anahtar seti izgarasi uzerinde paralel tarama')
+    sweep_parser.add_argument('--keysets', type=int, default=100,
+                              help='Rastgele anahtar seti sayisi (izgara verilmezse)')
+    sweep_parser.add_argument('--seeds', type=int, nargs='+', help='Izgara seed degerleri')
+    sweep_parser.add_argument('--affine', nargs='+', help='Izgara Affine ciftleri (A:B)')
+    sweep_parser.add_argument('--trans-keys', nargs='+', help='Izgara transposition anahtarlari')
+    sweep_parser.add_argument('--samples', type=int, default=10, help='Anahtar basina ornek sayisi')
+    sweep_parser.add_argument('--sample-size', type=int, default=12500, help='Ornek boyutu (byte)')
+    sweep_parser.add_argument('--plaintext', choices=['counter', 'zeros', 'random'], default='counter',
+                              help='Duz metin turu (varsayilan: counter)')
+    sweep_parser.add_argument('--workers', type=int, help='Surec sayisi (varsayilan: CPU sayisi)')
+    sweep_parser.add_argument('--output', default='sweep_results.npz', help='Sonuc dosyasi (.npz/.csv)')
+
+    check_parser = subparsers.add_parser('sweep-check',
+                                         help='Tarama ozetini os.urandom verisiyle dogrula')
+    check_parser.add_argument('--samples', type=int, default=1000, help='Ornek sayisi')
+    check_parser.add_argument('--sample-size', type=int, default=12500, help='Ornek boyutu (byte)')
+    check_parser.add_argument('--workers', type=int, help='Surec sayisi (varsayilan: CPU sayisi)')
+    args = parser.parse_args()
+
+    if args.command == 'sweep-check':
+        result = check_random_baseline(args.samples, args.sample_size, args.workers)
+        print_sweep_summary(result)
+        sys.exit(0 if sweep_verdict(result).all() else 1)
+
+    if args.command != 'sweep':
+        run_tests_and_save()
+        return
+
+    if args.seeds or args.affine or args.trans_keys:
+        affine_pairs = [tuple(int(v) for v in pair.split(':')) for pair in (args.affine or ['5:8'])]
+        keysets = build_keyset_grid(args.seeds or [27], affine_pairs, args.trans_keys or ['3142'])
+    else:
+        keysets = KeyGenerator().generate_keysets(args.keysets)
+
+    result = run_sweep(keysets, samples=args.samples, sample_size=args.sample_size,
+                       plaintext=args.plaintext, workers=args.workers, output=args.output)
+    print_sweep_summary(result)
+    print(f"\n[INFO] Sonuclar '{args.output}' dosyasina kaydedildi.")
+
+
 if __name__ == '__main__':
-    run_tests_and_save()
+    main()
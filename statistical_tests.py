@@ -6,29 +6,21 @@
 Şifreleme algoritmasının rastgelelik kalitesini ölçen testler.
 """
 
+import math
+import sys
 import numpy as np
-from scipy import stats
-from typing import List, Dict, Tuple
+from scipy import special, stats
+from typing import BinaryIO, List, Dict
 from collatz_crypto import CollatzCrypto
 
 
-def bits_to_list(data: bytes) -> List[int]:
-    """Byte dizisini bit listesine dönüştür."""
-    bits = []
-    for byte in data:
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    return bits
+def bits_to_list(data: bytes) -> np.ndarray:
+    """Byte dizisini bit dizisine dönüştür (her byte'ta ilk bit en anlamlı)."""
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
 
 
-def monobit_test(bits: List[int]) -> Dict:
-    """
-    Monobit (Frekans) Testi
-    Bit dizisindeki 0 ve 1'lerin dağılımını kontrol eder.
-    H0: Bitler eşit dağılmış (p > 0.01)
-    """
-    n = len(bits)
-    ones = sum(bits)
+def _monobit_result(n: int, ones: int) -> Dict:
+    """Monobit test sonucunu bit sayılarından hesapla."""
     zeros = n - ones
     
     # Test istatistiği
@@ -44,25 +36,11 @@ def monobit_test(bits: List[int]) -> Dict:
     }
 
 
-def chi_square_test(bits: List[int], block_size: int = 8) -> Dict:
-    """
-    Ki-Kare Testi
-    Bloklar halinde bit dağılımını kontrol eder.
-    """
-    n_blocks = len(bits) // block_size
+def _chi_square_result(chi_sq: float, n_blocks: int) -> Dict:
+    """Ki-kare test sonucunu blok istatistiğinden hesapla."""
     if n_blocks == 0:
-        return {'test_name': 'Ki-Kare Testi', 'error': 'Yetersiz veri'}
+        return {'test_name': 'Ki-Kare Testi', 'error': 'Yetersiz veri', 'passed': False}
     
-    block_sums = []
-    for i in range(n_blocks):
-        block = bits[i * block_size:(i + 1) * block_size]
-        block_sums.append(sum(block))
-    
-    # Her blokta beklenen 1 sayısı
-    expected = block_size / 2
-    
-    # Ki-kare istatistiği
-    chi_sq = sum((obs - expected) ** 2 / expected for obs in block_sums)
     df = n_blocks - 1
     p_value = 1 - stats.chi2.cdf(chi_sq, df)
     
@@ -74,13 +52,8 @@ def chi_square_test(bits: List[int], block_size: int = 8) -> Dict:
     }
 
 
-def runs_test(bits: List[int]) -> Dict:
-    """
-    Runs Testi
-    Ardışık aynı bitlerin (run) sayısını kontrol eder.
-    """
-    n = len(bits)
-    ones = sum(bits)
+def _runs_result(n: int, ones: int, runs: int) -> Dict:
+    """Runs test sonucunu bit ve run sayılarından hesapla."""
     pi = ones / n
     
     # Ön koşul kontrolü
@@ -92,12 +65,6 @@ def runs_test(bits: List[int]) -> Dict:
             'interpretation': 'Monobit testi başarısız, runs testi uygulanamaz'
         }
     
-    # Run sayısını hesapla
-    runs = 1
-    for i in range(1, n):
-        if bits[i] != bits[i-1]:
-            runs += 1
-    
     # Test istatistiği
     expected_runs = 2 * n * pi * (1 - pi) + 1
     variance = 2 * n * pi * (1 - pi) * (1 - 2 * pi * (1 - pi) / n)
@@ -122,19 +89,16 @@ def runs_test(bits: List[int]) -> Dict:
     }
 
 
-def frequency_analysis(data: bytes) -> Dict:
-    """Byte frekans analizi."""
-    freq = [0] * 256
-    for byte in data:
-        freq[byte] += 1
-    
-    n = len(data)
+def _frequency_result(freq: np.ndarray) -> Dict:
+    """Byte frekans analizi sonucunu 256 elemanlı histogramdan hesapla."""
+    n = int(freq.sum())
     expected = n / 256
-    chi_sq = sum((f - expected) ** 2 / expected for f in freq if expected > 0)
+    # 256 terim Python toplamıyla toplanır (önceki sonuçlarla birebir aynı)
+    chi_sq = sum(((freq - expected) ** 2 / expected).tolist()) if expected > 0 else 0
     df = 255
     p_value = 1 - stats.chi2.cdf(chi_sq, df)
     
-    non_zero = sum(1 for f in freq if f > 0)
+    non_zero = int(np.count_nonzero(freq))
     
     return {
         'test_name': 'Byte Frekans Analizi',
@@ -145,17 +109,456 @@ def frequency_analysis(data: bytes) -> Dict:
     }
 
 
-def run_all_tests(ciphertext_hex: str) -> List[Dict]:
-    """Tüm testleri çalıştır."""
-    data = bytes.fromhex(ciphertext_hex)
+def monobit_test(bits: np.ndarray) -> Dict:
+    """
+    Monobit (Frekans) Testi
+    Bit dizisindeki 0 ve 1'lerin dağılımını kontrol eder.
+    H0: Bitler eşit dağılmış (p > 0.01)
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    return _monobit_result(len(bits), int(np.count_nonzero(bits)))
+
+
+def _block_sums(bits: np.ndarray, block_size: int) -> np.ndarray:
+    """Tam blokların 1 sayılarını hesapla (artan bitler yok sayılır)."""
+    n_blocks = len(bits) // block_size
+    
+    # Blok toplamları: (blok sayısı, blok boyutu) matrisinin satır toplamı.
+    # Dar bloklarda sütunları toplamak satır bazlı indirgemeden çok daha hızlıdır.
+    blocks = bits[:n_blocks * block_size].reshape(n_blocks, block_size)
+    if block_size <= 64:
+        block_sums = np.zeros(n_blocks, dtype=np.int64)
+        for column in range(block_size):
+            block_sums += blocks[:, column]
+        return block_sums
+    return blocks.sum(axis=1, dtype=np.int64)
+
+
+def chi_square_test(bits: np.ndarray, block_size: int = 8) -> Dict:
+    """
+    Ki-Kare Testi
+    Bloklar halinde bit dağılımını kontrol eder.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n_blocks = len(bits) // block_size
+    if n_blocks == 0:
+        return _chi_square_result(0.0, 0)
+    
+    block_sums = _block_sums(bits, block_size)
+    
+    # Her blokta beklenen 1 sayısı
+    expected = block_size / 2
+    # cumsum soldan sağa sıralı toplar; sonuç önceki Python toplamıyla birebir aynıdır
+    chi_sq = float(np.cumsum((block_sums - expected) ** 2 / expected)[-1])
+    
+    return _chi_square_result(chi_sq, n_blocks)
+
+
+def runs_test(bits: np.ndarray) -> Dict:
+    """
+    Runs Testi
+    Ardışık aynı bitlerin (run) sayısını kontrol eder.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    
+    # Run sayısı = 1 + bit değişim sayısı (uint8 farkı taşsa da sıfırdan farklıdır)
+    runs = 1 + int(np.count_nonzero(np.diff(bits)))
+    return _runs_result(len(bits), int(np.count_nonzero(bits)), runs)
+
+
+def frequency_analysis(data: bytes) -> Dict:
+    """Byte frekans analizi."""
+    freq = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    return _frequency_result(freq)
+
+
+# ==================== NIST SP 800-22 TESTLERİ ====================
+
+# En uzun 1 run'ı testi: (n alt sınırı, blok boyutu M, sınıf sınırları, olasılıklar)
+_LONGEST_RUN_PARAMS = [
+    (750000, 10000, (10, 16), [0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727]),
+    (6272, 128, (4, 9), [0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124]),
+    (128, 8, (1, 4), [0.2148, 0.3672, 0.2305, 0.1875]),
+]
+
+
+def _insufficient(test_name: str) -> Dict:
+    return {'test_name': test_name, 'error': 'Yetersiz veri', 'passed': False}
+
+
+def _pattern_counts(bits: np.ndarray, m: int) -> np.ndarray:
+    """
+    Dairesel (sona ilk m-1 bit eklenmiş) örtüşen m-bitlik desenleri say.
+    
+    Desen değerleri m kaydırma-VEYA geçişiyle vektörel hesaplanır.
+    """
+    n = len(bits)
+    if m == 0:
+        return np.array([n], dtype=np.int64)
+    
+    extended = np.concatenate((bits, bits[:m - 1]))
+    values = np.zeros(n, dtype=np.int32)
+    for j in range(m):
+        values <<= 1
+        values |= extended[j:j + n]
+    return np.bincount(values, minlength=1 << m)
+
+
+def block_frequency_test(bits: np.ndarray, block_size: int = 128) -> Dict:
+    """
+    Blok Frekans Testi (NIST 2.2)
+    M bitlik bloklardaki 1 oranının 1/2'ye yakınlığını kontrol eder.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n_blocks = len(bits) // block_size
+    if n_blocks == 0:
+        return _insufficient('Blok Frekans Testi')
+    
+    proportions = _block_sums(bits, block_size) / block_size
+    chi_sq = 4 * block_size * float(np.sum((proportions - 0.5) ** 2))
+    p_value = float(special.gammaincc(n_blocks / 2, chi_sq / 2))
+    
+    return {
+        'test_name': 'Blok Frekans Testi',
+        'block_size': block_size, 'n_blocks': n_blocks,
+        'chi_square': chi_sq, 'p_value': p_value,
+        'passed': p_value >= 0.01
+    }
+
+
+def longest_run_test(bits: np.ndarray) -> Dict:
+    """
+    Bloktaki En Uzun 1 Run'ı Testi (NIST 2.4)
+    Blok başına en uzun ardışık 1 dizisinin dağılımını kontrol eder.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n = len(bits)
+    for min_n, block_size, (low, high), probabilities in _LONGEST_RUN_PARAMS:
+        if n >= min_n:
+            break
+    else:
+        return _insufficient("En Uzun 1 Run'ı Testi")
+    
+    n_blocks = n // block_size
+    blocks = bits[:n_blocks * block_size].reshape(n_blocks, block_size)
+    
+    # Her satırı iki uçtan sıfırla çevrele; farkın +1/-1 olduğu yerler run başı/sonu
+    padded = np.zeros((n_blocks, block_size + 2), dtype=np.int8)
+    padded[:, 1:-1] = blocks
+    edges = np.diff(padded, axis=1)
+    start_rows, start_cols = np.nonzero(edges == 1)
+    _, end_cols = np.nonzero(edges == -1)
+    
+    longest = np.zeros(n_blocks, dtype=np.int64)
+    np.maximum.at(longest, start_rows, end_cols - start_cols)
+    
+    # Sınıf sayıları: low ve altı, aradakiler, high ve üstü
+    observed = np.bincount(np.clip(longest, low, high) - low, minlength=high - low + 1)
+    expected = n_blocks * np.array(probabilities)
+    chi_sq = float(np.sum((observed - expected) ** 2 / expected))
+    p_value = float(special.gammaincc((len(probabilities) - 1) / 2, chi_sq / 2))
+    
+    return {
+        'test_name': "En Uzun 1 Run'ı Testi",
+        'block_size': block_size, 'n_blocks': n_blocks,
+        'chi_square': chi_sq, 'p_value': p_value,
+        'passed': p_value >= 0.01
+    }
+
+
+def dft_test(bits: np.ndarray) -> Dict:
+    """
+    Ayrık Fourier Dönüşümü (Spektral) Testi (NIST 2.6)
+    Periyodik örüntüleri DFT genliklerinin eşik altı oranıyla arar.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n = len(bits)
+    if n == 0:
+        return _insufficient('DFT (Spektral) Testi')
+    
+    x = 2.0 * bits - 1.0
+    modulus = np.abs(np.fft.rfft(x)[:n // 2])
+    
+    threshold = math.sqrt(math.log(1 / 0.05) * n)
+    expected_below = 0.95 * n / 2
+    observed_below = int(np.count_nonzero(modulus < threshold))
+    d = (observed_below - expected_below) / math.sqrt(n * 0.95 * 0.05 / 4)
+    p_value = math.erfc(abs(d) / math.sqrt(2))
+    
+    return {
+        'test_name': 'DFT (Spektral) Testi',
+        'threshold': threshold, 'observed_below': observed_below,
+        'expected_below': expected_below, 'd': d,
+        'p_value': p_value, 'passed': p_value >= 0.01
+    }
+
+
+def serial_test(bits: np.ndarray, m: int = None) -> Dict:
+    """
+    Seri Test (NIST 2.11)
+    Örtüşen m-bitlik desenlerin tüm olası desenlere eşit dağılımını kontrol eder.
+    m verilmezse n'e göre seçilir (m < log2(n) - 2).
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n = len(bits)
+    if m is None:
+        m = min(16, int(math.log2(n)) - 3) if n > 0 else 0
+    if m < 2 or n == 0:
+        return _insufficient('Seri Test')
+    
+    # m deseni sayılarından m-1 ve m-2 sayıları katlanarak elde edilir
+    counts = _pattern_counts(bits, m)
+    psi = []
+    for k in (m, m - 1, m - 2):
+        psi.append(float((1 << k) / n * np.sum(counts.astype(np.float64) ** 2) - n) if k > 0 else 0.0)
+        counts = counts.reshape(-1, 2).sum(axis=1) if k > 0 else counts
+    
+    delta1 = psi[0] - psi[1]
+    delta2 = psi[0] - 2 * psi[1] + psi[2]
+    p_value_1 = float(special.gammaincc(2 ** (m - 2), delta1 / 2))
+    p_value_2 = float(special.gammaincc(2 ** (m - 3), delta2 / 2))
+    
+    return {
+        'test_name': 'Seri Test',
+        'm': m, 'delta_psi': delta1, 'delta2_psi': delta2,
+        'p_value_1': p_value_1, 'p_value_2': p_value_2,
+        'p_value': min(p_value_1, p_value_2),
+        'passed': p_value_1 >= 0.01 and p_value_2 >= 0.01
+    }
+
+
+def approximate_entropy_test(bits: np.ndarray, m: int = None) -> Dict:
+    """
+    Yaklaşık Entropi Testi (NIST 2.12)
+    Ardışık m ve m+1 bitlik örtüşen desenlerin frekanslarını karşılaştırır.
+    m verilmezse n'e göre seçilir: her (m+1)-bitlik desen için ortalama en
+    az 128 gözlem düşer. NIST sınırı (m < log2(n) - 5) kısa dizilerde ki-kare
+    yaklaşımını bozar ve rastgele veride bile p-değerlerini küçüğe kaydırır.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n = len(bits)
+    if m is None:
+        m = min(10, int(math.log2(n)) - 8) if n > 0 else 0
+    if m < 1 or n == 0:
+        return _insufficient('Yaklaşık Entropi Testi')
+    
+    counts = _pattern_counts(bits, m + 1)
+    phi = []
+    for _ in range(2):
+        frequencies = counts[counts > 0] / n
+        phi.append(float(np.sum(frequencies * np.log(frequencies))))
+        counts = counts.reshape(-1, 2).sum(axis=1)
+    
+    # phi[0] = φ(m+1), phi[1] = φ(m)
+    ap_en = phi[1] - phi[0]
+    chi_sq = 2 * n * (math.log(2) - ap_en)
+    p_value = float(special.gammaincc(2 ** (m - 1), chi_sq / 2))
+    
+    return {
+        'test_name': 'Yaklaşık Entropi Testi',
+        'm': m, 'ap_en': ap_en, 'chi_square': chi_sq,
+        'p_value': p_value, 'passed': p_value >= 0.01
+    }
+
+
+def _cusum_p_value(n: int, z: int) -> float:
+    """Kümülatif toplamlar testinin p-değeri (NIST 2.13.4)."""
+    sqrt_n = math.sqrt(n)
+    norm_cdf = stats.norm.cdf
+    
+    k = np.arange(int((-n / z + 1) // 4), int((n / z - 1) // 4) + 1)
+    sum1 = np.sum(norm_cdf((4 * k + 1) * z / sqrt_n) - norm_cdf((4 * k - 1) * z / sqrt_n))
+    k = np.arange(int((-n / z - 3) // 4), int((n / z - 1) // 4) + 1)
+    sum2 = np.sum(norm_cdf((4 * k + 3) * z / sqrt_n) - norm_cdf((4 * k + 1) * z / sqrt_n))
+    
+    return float(1 - sum1 + sum2)
+
+
+def cumulative_sums_test(bits: np.ndarray) -> Dict:
+    """
+    Kümülatif Toplamlar Testi (NIST 2.13)
+    ±1 dizisinin ileri ve geri kısmi toplamlarının en büyük sapmasını ölçer.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    n = len(bits)
+    if n == 0:
+        return _insufficient('Kümülatif Toplamlar Testi')
+    
+    partial = np.cumsum(2 * bits.astype(np.int64) - 1)
+    total = int(partial[-1])
+    
+    # İleri: max|S_k|; geri: max|S_n - S_k| (k = 0 dahil)
+    z_forward = int(np.max(np.abs(partial)))
+    z_backward = max(abs(total), int(np.max(np.abs(total - partial[:-1]))) if n > 1 else 0)
+    
+    p_forward = _cusum_p_value(n, z_forward)
+    p_backward = _cusum_p_value(n, z_backward)
+    
+    return {
+        'test_name': 'Kümülatif Toplamlar Testi',
+        'z_forward': z_forward, 'z_backward': z_backward,
+        'p_value_forward': p_forward, 'p_value_backward': p_backward,
+        'p_value': min(p_forward, p_backward),
+        'passed': p_forward >= 0.01 and p_backward >= 0.01
+    }
+
+
+# NIST SP 800-22 örnekleri: 2.1.8 / 2.2.8 / 2.12.8 / 2.13.8'deki π'nin ilk 100 biti
+# ve 2.4.8'deki 128 bitlik dizi
+_NIST_PI_100 = ('11001001000011111101101010100010001000010110100011'
+                '00001000110100110001001100011001100010100010111000')
+_NIST_LONGEST_RUN_128 = ('11001100000101010110110001001100111000000000001001001101010100010001'
+                         '001111010110100000001101011111001100111001101101100010110010')
+
+# (test, bit dizisi, parametreler, sonuç alanı, yayımlanmış p-değeri, tolerans)
+# Spesifikasyondaki en uzun run olasılıkları yuvarlanmış olduğundan o örnek
+# yalnızca ~1e-5 düzeyinde tutar.
+_NIST_EXAMPLES = [
+    (monobit_test, _NIST_PI_100, {}, 'p_value', 0.109599, 1e-6),
+    (block_frequency_test, _NIST_PI_100, {'block_size': 10}, 'p_value', 0.706438, 1e-6),
+    (longest_run_test, _NIST_LONGEST_RUN_128, {}, 'p_value', 0.180609, 2e-5),
+    (serial_test, '0011011101', {'m': 3}, 'p_value_1', 0.808792, 1e-6),
+    (serial_test, '0011011101', {'m': 3}, 'p_value_2', 0.670320, 1e-6),
+    (approximate_entropy_test, '0100110101', {'m': 3}, 'p_value', 0.261961, 1e-6),
+    (approximate_entropy_test, _NIST_PI_100, {'m': 2}, 'p_value', 0.235301, 1e-6),
+    (cumulative_sums_test, _NIST_PI_100, {}, 'p_value_forward', 0.219194, 1e-6),
+    (cumulative_sums_test, _NIST_PI_100, {}, 'p_value_backward', 0.114866, 1e-6),
+]
+
+
+def selftest() -> bool:
+    """
+    Testleri NIST SP 800-22'de yayımlanmış örnek dizilerle doğrula.
+    
+    Returns:
+        Tüm örnekler tolerans içindeyse True
+    """
+    ok = True
+    for test, sequence, params, field, expected, tolerance in _NIST_EXAMPLES:
+        bits = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8) - ord('0')
+        actual = test(bits, **params)[field]
+        passed = abs(actual - expected) <= tolerance
+        ok &= passed
+        print(f"  {'✅' if passed else '❌'} {test.__name__:<26} {field:<17} "
+              f"beklenen={expected:.6f}  hesaplanan={actual:.6f}")
+    return ok
+
+
+def run_all_tests(ciphertext_hex: str, extended: bool = True) -> List[Dict]:
+    """
+    Tüm testleri çalıştır.
+    
+    Args:
+        ciphertext_hex: Şifreli veri (hex)
+        extended: True ise NIST SP 800-22 testleri de çalıştırılır
+    """
+    return run_tests_on_bytes(bytes.fromhex(ciphertext_hex), extended)
+
+
+def run_tests_on_bytes(data: bytes, extended: bool = True) -> List[Dict]:
+    """Tüm testleri ham şifreli veri üzerinde çalıştır."""
     bits = bits_to_list(data)
     
-    return [
+    results = [
         monobit_test(bits),
         chi_square_test(bits),
         runs_test(bits),
         frequency_analysis(data)
     ]
+    if extended:
+        results += [
+            block_frequency_test(bits),
+            longest_run_test(bits),
+            dft_test(bits),
+            serial_test(bits),
+            approximate_entropy_test(bits),
+            cumulative_sums_test(bits)
+        ]
+    return results
+
+
+class StreamingTester:
+    """
+    Sabit bellekli, artımlı istatistiksel test toplayıcısı.
+    
+    Şifreli veri parça parça `update` ile verilir; yalnızca yeterli
+    istatistikler tutulur (1 sayısı, ki-kare kısmi toplamı, run sayısı ve
+    parçalar arası sınır biti, 256 kutulu byte histogramı).
+    `finalize` sonucu, aynı verinin tamamı üzerinde temel testlerle
+    (`run_all_tests(..., extended=False)`) birebir aynıdır.
+    """
+    
+    def __init__(self, block_size: int = 8):
+        self.block_size = block_size
+        self.n_bits = 0
+        self.ones = 0
+        self.n_blocks = 0
+        self.chi_square = 0.0
+        self.transitions = 0
+        self.histogram = np.zeros(256, dtype=np.int64)
+        self._last_bit = None
+        self._carry = np.zeros(0, dtype=np.uint8)  # Tamamlanmamış blok bitleri
+    
+    def update(self, chunk: bytes):
+        """Bir şifreli veri parçasını istatistiklere ekle."""
+        if len(chunk) == 0:
+            return
+        
+        data = np.frombuffer(chunk, dtype=np.uint8)
+        bits = np.unpackbits(data)
+        
+        self.n_bits += len(bits)
+        self.ones += int(np.count_nonzero(bits))
+        self.histogram += np.bincount(data, minlength=256)
+        
+        # Run sayısı: parça içi değişimler + önceki parçanın son bitiyle sınır
+        self.transitions += int(np.count_nonzero(np.diff(bits)))
+        if self._last_bit is not None and bits[0] != self._last_bit:
+            self.transitions += 1
+        self._last_bit = bits[-1]
+        
+        # Ki-kare: önceki parçadan kalan bitler bu parçanın başına eklenir
+        if len(self._carry):
+            bits = np.concatenate((self._carry, bits))
+        n_blocks = len(bits) // self.block_size
+        self._carry = bits[n_blocks * self.block_size:].copy()
+        
+        if n_blocks:
+            expected = self.block_size / 2
+            terms = (_block_sums(bits, self.block_size) - expected) ** 2 / expected
+            # Sıralı toplama önceki kısmi toplamdan devam edilir
+            terms[0] += self.chi_square
+            self.chi_square = float(np.cumsum(terms)[-1])
+            self.n_blocks += n_blocks
+    
+    def finalize(self) -> List[Dict]:
+        """Toplanan istatistiklerden temel test sonuçlarını üret."""
+        return [
+            _monobit_result(self.n_bits, self.ones),
+            _chi_square_result(self.chi_square, self.n_blocks),
+            _runs_result(self.n_bits, self.ones, 1 + self.transitions),
+            _frequency_result(self.histogram)
+        ]
+
+
+def run_stream_tests(reader: BinaryIO, chunk_size: int = 1 << 20) -> List[Dict]:
+    """
+    İkili bir akıştaki (örn. şifreli dosya) veriyi sabit bellekle test et.
+    
+    Args:
+        reader: Şifreli veri okuma akışı
+        chunk_size: Parça boyutu (byte)
+        
+    Returns:
+        `run_all_tests(..., extended=False)` ile aynı sonuç listesi
+    """
+    tester = StreamingTester()
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            break
+        tester.update(chunk)
+    return tester.finalize()
 
 
 def print_results(results: List[Dict]):
@@ -186,7 +589,11 @@ def print_results(results: List[Dict]):
 
 
 def main():
-    """Demo: Örnek metin şifrele ve test et."""
+    """Demo: Örnek metin şifrele ve test et (`selftest` ile NIST örneklerini doğrula)."""
+    if sys.argv[1:] == ['selftest']:
+        print("\n🔬 NIST SP 800-22 örnek doğrulaması")
+        sys.exit(0 if selftest() else 1)
+    
     print("\n🔬 Collatz Kriptografik Algoritma - İstatistiksel Testler")
     print("="*70)
     